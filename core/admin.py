@@ -1,14 +1,33 @@
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
 from .models import Meeting, Transcript, Insight, AudioChunk
 
 
+class NoCountPaginator(Paginator):
+    """
+    Paginator that skips the SELECT COUNT(*) issued on every changelist load.
+
+    AudioChunk and Transcript tables grow with every processed meeting, so
+    the exact count query dominates page render time; a large fixed count
+    keeps pagination links working without scanning the table.
+    """
+
+    @cached_property
+    def count(self):
+        return 9999999
+
+
 @admin.register(Meeting)
 class MeetingAdmin(admin.ModelAdmin):
     list_display = ['title', 'created_by', 'created_at', 'updated_at']
     list_filter = ['created_at', 'updated_at', 'created_by']
+    list_select_related = ['created_by']
     search_fields = ['title', 'description']
+    autocomplete_fields = ['created_by']
     readonly_fields = ['id', 'created_at', 'updated_at']
     ordering = ['-created_at']
+    sortable_by = ['created_at']
     
     fieldsets = (
         (None, {
@@ -25,9 +44,14 @@ class MeetingAdmin(admin.ModelAdmin):
 class TranscriptAdmin(admin.ModelAdmin):
     list_display = ['meeting', 'whisper_model', 'status', 'progress', 'created_at']
     list_filter = ['status', 'whisper_model', 'created_at']
-    search_fields = ['meeting__title', 'text']
+    list_select_related = ['meeting']
+    paginator = NoCountPaginator
+    show_full_result_count = False
+    search_fields = ['meeting__title']
+    raw_id_fields = ['meeting']
     readonly_fields = ['created_at', 'updated_at']
     ordering = ['-created_at']
+    sortable_by = ['created_at']
     
     fieldsets = (
         (None, {
@@ -48,9 +72,12 @@ class TranscriptAdmin(admin.ModelAdmin):
 class InsightAdmin(admin.ModelAdmin):
     list_display = ['meeting', 'status', 'progress', 'created_at']
     list_filter = ['status', 'created_at']
-    search_fields = ['meeting__title', 'situation', 'insights']
+    list_select_related = ['meeting']
+    search_fields = ['meeting__title']
+    raw_id_fields = ['meeting']
     readonly_fields = ['created_at', 'updated_at']
     ordering = ['-created_at']
+    sortable_by = ['created_at']
     
     fieldsets = (
         (None, {
@@ -75,9 +102,14 @@ class InsightAdmin(admin.ModelAdmin):
 class AudioChunkAdmin(admin.ModelAdmin):
     list_display = ['meeting', 'chunk_index', 'start_time', 'end_time', 'duration', 'status', 'created_at']
     list_filter = ['status', 'created_at']
-    search_fields = ['meeting__title', 'transcript_text']
+    list_select_related = ['meeting']
+    paginator = NoCountPaginator
+    show_full_result_count = False
+    search_fields = ['meeting__title']
+    raw_id_fields = ['meeting']
     readonly_fields = ['created_at', 'updated_at']
     ordering = ['meeting', 'chunk_index']
+    sortable_by = ['meeting', 'chunk_index', 'created_at']
     
     fieldsets = (
         (None, {
@@ -5,13 +5,181 @@ Implements external transcription using AssemblyAI's Speech-to-Text API.
 """
 
 import logging
+import os
 import requests
+import threading
 import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, List
+from django.conf import settings
 from .external_transcribers import ExternalAPITranscriber, TranscriptionResult
 
+# httpx is optional: when present, the upload+poll pipeline shares one
+# keep-alive connection pool instead of paying TCP+TLS setup per request
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# orjson is optional: completed AssemblyAI responses can be multi-MB (word
+# timestamps, highlights), where its C decoder is several times faster than
+# the stdlib json used by response.json()
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Compiled once: validate_configuration runs per transcriber construction
+_VALID_MODELS = frozenset({'best', 'nano'})
+
+
+def _parse_json(response):
+    """Decode a JSON response body with orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# Upload files in fixed-size blocks so peak memory stays at O(block_size)
+# instead of O(file_size) for multi-GB audio uploads
+UPLOAD_BLOCK_SIZE = 4 * 1024 * 1024  # 4 MiB
+
+
+def _iter_file(file_obj, block_size: int = UPLOAD_BLOCK_SIZE):
+    """
+    Yield fixed-size blocks from a file object for streaming uploads
+
+    Reads into a single preallocated buffer with readinto() so the upload
+    loop does not allocate a fresh block-sized bytes object per iteration.
+    Each yielded view is consumed (sent on the socket) before the next read
+    overwrites the buffer.
+    """
+    buffer = bytearray(block_size)
+    view = memoryview(buffer)
+    while True:
+        read_bytes = file_obj.readinto(buffer)
+        if not read_bytes:
+            return
+        yield view[:read_bytes]
+
+
+# Static provider metadata and pricing, lifted to module scope so the usage
+# and cost endpoints don't rebuild them on every call
+_ASSEMBLYAI_USAGE_INFO = {
+    'pricing': '~$0.65 per hour (varies by features)',
+    'features': [
+        'High accuracy transcription',
+        'Automatic punctuation and formatting',
+        'Language detection',
+        'Sentiment analysis',
+        'Content moderation',
+        'Auto highlights',
+        'Speaker diarization',
+        'PII redaction'
+    ],
+    'documentation': 'https://www.assemblyai.com/docs/',
+    'rate_limits': 'Generous rate limits',
+    'supported_languages': [
+        'English', 'Spanish', 'French', 'German', 'Italian',
+        'Portuguese', 'Dutch', 'Hindi', 'Japanese', 'Chinese',
+        'Korean', 'Russian', 'Arabic', 'Vietnamese', 'Ukrainian',
+        'and more'
+    ],
+    'models': {
+        'best': 'Highest accuracy, slower processing',
+        'nano': 'Fastest processing, good accuracy'
+    }
+}
+
+_BASE_COST_PER_HOUR = 0.65
+_FEATURE_COSTS_PER_HOUR = {
+    'sentiment_analysis': 0.1,
+    'auto_highlights': 0.05,
+    'content_safety': 0.1
+}
+_TOTAL_COST_PER_HOUR = _BASE_COST_PER_HOUR + sum(_FEATURE_COSTS_PER_HOUR.values())
+
+class TokenBucket:
+    """
+    Thread-safe token bucket used to smooth bursts of API requests.
+
+    AssemblyAI enforces a request budget per 5-minute window; without
+    smoothing, many concurrent meetings polling at once can trip 429s and
+    waste connections on hot retries.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait_time = (1 - self.tokens) / self.rate
+
+            time.sleep(wait_time)
+
+
+# One bucket per process so all transcriber instances share the budget
+_request_bucket = TokenBucket(rate=60, capacity=120)
+
+
+# Module-level registry of webhook completion events, keyed by transcript ID.
+# When AssemblyAI POSTs a completion callback, the waiting poll loop is woken
+# immediately instead of sleeping out its full backoff delay.
+_webhook_events = {}
+_webhook_lock = threading.Lock()
+
+
+def register_webhook_event(transcript_id: str) -> threading.Event:
+    """Register an event that the webhook view can signal for a transcript"""
+    with _webhook_lock:
+        event = _webhook_events.get(transcript_id)
+        if event is None:
+            event = threading.Event()
+            _webhook_events[transcript_id] = event
+        return event
+
+
+def unregister_webhook_event(transcript_id: str):
+    """Remove the webhook event for a transcript once polling is finished"""
+    with _webhook_lock:
+        _webhook_events.pop(transcript_id, None)
+
+
+def notify_webhook_completion(transcript_id: str):
+    """
+    Signal that AssemblyAI reported completion for a transcript via webhook
+
+    Args:
+        transcript_id: ID of the transcription job from the webhook payload
+    """
+    with _webhook_lock:
+        event = _webhook_events.get(transcript_id)
+
+    if event:
+        event.set()
+        logger.info(f"Webhook completion received for transcript {transcript_id}")
+    else:
+        logger.warning(f"Webhook received for unknown transcript {transcript_id}")
+
 
 class AssemblyAITranscriber(ExternalAPITranscriber):
     """AssemblyAI Speech-to-Text API transcription implementation"""
@@ -23,9 +191,45 @@ class AssemblyAITranscriber(ExternalAPITranscriber):
         self.transcription_endpoint = f"{self.base_url}/transcript"
         
         # AssemblyAI-specific settings
-        self.polling_interval = 2  # Poll every 2 seconds for status
+        self.polling_interval = 2  # Initial poll delay, doubled on each attempt
+        self.max_polling_interval = 30  # Cap for exponential backoff delay
         self.max_polling_time = 600  # Maximum 10 minutes polling
+
+        # Optional webhook callback so AssemblyAI notifies us on completion
+        # instead of us discovering it through polling alone
+        self.webhook_url = getattr(settings, 'ASSEMBLYAI_WEBHOOK_URL', None)
+
+        # Single keep-alive session for all AssemblyAI requests: polling up
+        # to 300 times per job through module-level requests.get would pay
+        # a TLS handshake per poll
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, status_forcelist=[502, 503, 504], backoff_factor=0.3)
+        ))
+
+        # Process-wide token bucket smoothing submission and poll bursts
+        self.limiter = _request_bucket
+
+        # Pooled keep-alive client shared by upload, submission and polling
+        # when httpx is installed; falls back to requests otherwise
+        self.http_client = None
+        if HTTPX_AVAILABLE:
+            self.http_client = httpx.Client(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=4)
+            )
     
+    def __del__(self):
+        """Release pooled connections when the transcriber is dropped"""
+        try:
+            self.session.close()
+            if self.http_client is not None:
+                self.http_client.close()
+        except Exception:
+            pass
+
     def _get_default_model(self) -> str:
         """Get default model for AssemblyAI"""
         return "best"  # AssemblyAI's highest accuracy model
@@ -53,16 +257,39 @@ class AssemblyAITranscriber(ExternalAPITranscriber):
             "content-type": "application/octet-stream"
         }
         
+        self.limiter.acquire()
+
         with open(audio_file_path, 'rb') as f:
-            response = requests.post(
-                self.upload_endpoint,
-                headers=headers,
-                data=f,
-                timeout=self.timeout
-            )
+            # Hint sequential read-ahead to the kernel where supported
+            if hasattr(os, 'posix_fadvise'):
+                try:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass
+
+            # Stream the file in fixed-size blocks (Transfer-Encoding: chunked)
+            # instead of handing the HTTP library the raw file handle, which
+            # can buffer the entire file for content-length computation
+            if self.http_client is not None:
+                # Known length lets the server preallocate and skips
+                # chunked transfer framing entirely
+                upload_headers = dict(headers)
+                upload_headers["content-length"] = str(os.path.getsize(audio_file_path))
+                response = self.http_client.post(
+                    self.upload_endpoint,
+                    headers=upload_headers,
+                    content=_iter_file(f)
+                )
+            else:
+                response = self.session.post(
+                    self.upload_endpoint,
+                    headers=headers,
+                    data=_iter_file(f),
+                    timeout=self.timeout
+                )
         
         if response.status_code == 200:
-            return response.json()['upload_url']
+            return _parse_json(response)['upload_url']
         else:
             raise Exception(f"File upload failed: {response.status_code} - {response.text}")
     
@@ -107,7 +334,11 @@ class AssemblyAITranscriber(ExternalAPITranscriber):
             "auto_highlights": True,
             "content_safety": False
         })
-        
+
+        # Ask AssemblyAI to POST completion to our webhook endpoint when configured
+        if self.webhook_url:
+            data["webhook_url"] = self.webhook_url
+
         return self.transcription_endpoint, headers, data, 'json'
     
     def _poll_transcription_status(self, transcript_id: str) -> Dict[str, Any]:
@@ -126,28 +357,56 @@ class AssemblyAITranscriber(ExternalAPITranscriber):
         
         status_url = f"{self.transcription_endpoint}/{transcript_id}"
         start_time = time.time()
-        
-        while time.time() - start_time < self.max_polling_time:
-            response = requests.get(status_url, headers=headers, timeout=30)
-            
-            if response.status_code == 200:
-                data = response.json()
-                status = data.get('status')
-                
-                if status == 'completed':
-                    return data
-                elif status == 'error':
-                    error_msg = data.get('error', 'Unknown error')
-                    raise Exception(f"Transcription failed: {error_msg}")
-                elif status in ['queued', 'processing']:
-                    logger.debug(f"Transcription {transcript_id} status: {status}")
-                    time.sleep(self.polling_interval)
+        attempt = 0
+
+        # Register for webhook wake-up so a completion callback ends the
+        # backoff wait immediately instead of sleeping the full delay
+        webhook_event = register_webhook_event(transcript_id)
+
+        try:
+            while time.time() - start_time < self.max_polling_time:
+                self.limiter.acquire()
+
+                if self.http_client is not None:
+                    response = self.http_client.get(status_url, headers=headers, timeout=30)
                 else:
-                    raise Exception(f"Unknown status: {status}")
-            else:
-                raise Exception(f"Status check failed: {response.status_code} - {response.text}")
-        
-        raise Exception(f"Transcription timeout after {self.max_polling_time}s")
+                    response = self.session.get(status_url, headers=headers, timeout=30)
+
+                if response.status_code == 429:
+                    # Rate limited: honor Retry-After instead of retrying hot
+                    retry_after = response.headers.get('Retry-After')
+                    try:
+                        delay = float(retry_after)
+                    except (TypeError, ValueError):
+                        delay = self.max_polling_interval
+                    logger.warning(f"AssemblyAI rate limited, waiting {delay}s before next poll")
+                    webhook_event.wait(timeout=delay)
+                    continue
+
+                if response.status_code == 200:
+                    data = _parse_json(response)
+                    status = data.get('status')
+
+                    if status == 'completed':
+                        return data
+                    elif status == 'error':
+                        error_msg = data.get('error', 'Unknown error')
+                        raise Exception(f"Transcription failed: {error_msg}")
+                    elif status in ['queued', 'processing']:
+                        # Exponential backoff: 2s -> 4s -> 8s, capped
+                        delay = min(self.polling_interval * (2 ** attempt), self.max_polling_interval)
+                        attempt += 1
+                        logger.debug(f"Transcription {transcript_id} status: {status}, "
+                                     f"next poll in {delay}s")
+                        webhook_event.wait(timeout=delay)
+                    else:
+                        raise Exception(f"Unknown status: {status}")
+                else:
+                    raise Exception(f"Status check failed: {response.status_code} - {response.text}")
+
+            raise Exception(f"Transcription timeout after {self.max_polling_time}s")
+        finally:
+            unregister_webhook_event(transcript_id)
     
     def _parse_response(self, response: requests.Response) -> TranscriptionResult:
         """
@@ -160,7 +419,7 @@ class AssemblyAITranscriber(ExternalAPITranscriber):
             TranscriptionResult object
         """
         # Initial response contains transcript ID
-        initial_data = response.json()
+        initial_data = _parse_json(response)
         transcript_id = initial_data.get('id')
         
         if not transcript_id:
@@ -203,9 +462,8 @@ class AssemblyAITranscriber(ExternalAPITranscriber):
             return is_valid, error_msg
         
         # Validate model
-        valid_models = ['best', 'nano']
-        if self.api_model not in valid_models:
-            return False, f"Invalid AssemblyAI model: {self.api_model}. Valid models: {', '.join(valid_models)}"
+        if self.api_model not in _VALID_MODELS:
+            return False, f"Invalid AssemblyAI model: {self.api_model}. Valid models: {', '.join(sorted(_VALID_MODELS))}"
         
         return True, ""
     
@@ -217,31 +475,7 @@ class AssemblyAITranscriber(ExternalAPITranscriber):
             Dictionary with usage information
         """
         info = super().get_usage_info()
-        info.update({
-            'pricing': '~$0.65 per hour (varies by features)',
-            'features': [
-                'High accuracy transcription',
-                'Automatic punctuation and formatting',
-                'Language detection',
-                'Sentiment analysis',
-                'Content moderation',
-                'Auto highlights',
-                'Speaker diarization',
-                'PII redaction'
-            ],
-            'documentation': 'https://www.assemblyai.com/docs/',
-            'rate_limits': 'Generous rate limits',
-            'supported_languages': [
-                'English', 'Spanish', 'French', 'German', 'Italian',
-                'Portuguese', 'Dutch', 'Hindi', 'Japanese', 'Chinese',
-                'Korean', 'Russian', 'Arabic', 'Vietnamese', 'Ukrainian',
-                'and more'
-            ],
-            'models': {
-                'best': 'Highest accuracy, slower processing',
-                'nano': 'Fastest processing, good accuracy'
-            }
-        })
+        info.update(_ASSEMBLYAI_USAGE_INFO)
         return info
     
     def estimate_cost(self, duration_hours: float) -> Dict[str, Any]:
@@ -254,22 +488,12 @@ class AssemblyAITranscriber(ExternalAPITranscriber):
         Returns:
             Cost estimation dictionary
         """
-        # Base transcription cost
-        base_cost_per_hour = 0.65
-        
-        # Additional feature costs (estimated)
-        feature_costs = {
-            'sentiment_analysis': 0.1,
-            'auto_highlights': 0.05,
-            'content_safety': 0.1
-        }
-        
-        total_cost = duration_hours * (base_cost_per_hour + sum(feature_costs.values()))
-        
+        total_cost = duration_hours * _TOTAL_COST_PER_HOUR
+
         return {
             'duration_hours': duration_hours,
-            'base_cost_per_hour_usd': base_cost_per_hour,
-            'feature_costs_per_hour_usd': feature_costs,
+            'base_cost_per_hour_usd': _BASE_COST_PER_HOUR,
+            'feature_costs_per_hour_usd': _FEATURE_COSTS_PER_HOUR,
             'estimated_total_cost_usd': total_cost,
             'currency': 'USD',
             'notes': 'Pricing estimates. Check AssemblyAI pricing page for current rates.'
@@ -11,18 +11,101 @@ Features:
 - Memory-efficient processing
 """
 
+import functools
 import os
 import logging
+import shutil
+import time
+import numpy as np
 import torchaudio
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pydub import AudioSegment
-from typing import List, Tuple, Optional
+
+# soundfile reads only the file header for WAV/FLAC duration lookups,
+# avoiding the frame scans some torchaudio backends perform
+try:
+    import soundfile
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    SOUNDFILE_AVAILABLE = False
+from typing import Dict, List, Tuple, Optional
 from django.conf import settings
+from django.db import transaction
 from .models import Meeting, AudioChunk
 from .utils import detect_speech_segments
 
 logger = logging.getLogger(__name__)
 
 
+# Format-specific compression ratios (MB per minute) for size-based duration
+# estimation. Adjusted to more conservative estimates for typical user uploads.
+_COMPRESSION_RATIOS = {
+    '.mp3': 1.0,    # ~1MB per minute (more conservative for typical MP3s)
+    '.wav': 10.0,   # Uncompressed WAV
+    '.m4a': 0.5,    # ~0.5MB per minute (conservative M4A/AAC)
+    '.mp4': 0.8,    # ~0.8MB per minute (MP4 audio)
+    '.flac': 5.0,   # Lossless compression
+    '.ogg': 0.8,    # ~0.8MB per minute OGG Vorbis
+    '.aac': 0.5,    # ~0.5MB per minute AAC
+}
+
+
+# Module-level duration probes cached by (path, size, mtime_ns) so a file is
+# only probed once per content version, across every AudioChunker instance.
+# Including size and mtime in the key invalidates stale entries when a file
+# is replaced in place.
+
+@functools.lru_cache(maxsize=32)
+def _cached_speech_segments(audio_path: str, size: int, mtime_ns: int) -> Tuple[Tuple[float, Optional[float]], ...]:
+    """
+    Run VAD once per file content version and memoize the segments
+
+    The VAD pass decodes the whole file, which dominates chunking cost on
+    long recordings, so re-chunking attempts and retries reuse the result.
+    Returned as a tuple of tuples so the cache holds immutable values.
+    """
+    return tuple(detect_speech_segments(audio_path))
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_duration_soundfile(audio_path: str, size: int, mtime_ns: int) -> float:
+    """Get duration using soundfile (header-only read for WAV/FLAC)"""
+    if not SOUNDFILE_AVAILABLE:
+        raise Exception("soundfile not installed")
+    info = soundfile.info(audio_path)
+    return info.frames / info.samplerate
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_duration_torchaudio(audio_path: str, size: int, mtime_ns: int) -> float:
+    """Get duration using torchaudio (most reliable for various formats)"""
+    info = torchaudio.info(audio_path)
+    return info.num_frames / info.sample_rate
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_duration_ffprobe(audio_path: str, size: int, mtime_ns: int) -> float:
+    """Get duration using ffprobe command (most comprehensive)"""
+    import subprocess
+
+    # Ask for just the duration as bare CSV — no JSON to format or parse
+    cmd = [
+        'ffprobe', '-v', 'error',
+        '-show_entries', 'format=duration', '-of', 'csv=p=0',
+        audio_path
+    ]
+
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+    if result.returncode != 0:
+        raise Exception(f"ffprobe failed: {result.stderr}")
+
+    duration_str = result.stdout.strip()
+    if duration_str and duration_str != 'N/A':
+        return float(duration_str)
+
+    raise Exception("Duration not found in ffprobe output")
+
+
 class AudioChunker:
     """
     Handles chunking of large audio files using VAD-aware and time-based strategies
@@ -33,17 +116,15 @@ class AudioChunker:
                  overlap_duration: float = None,  # Will use settings or default
                  max_chunk_duration: float = None,  # Will use settings or default
                  min_chunk_duration: float = None):  # Will use settings or default
-        
-        # Load from Django settings with fallbacks
-        from django.conf import settings
-        
+
+        # Load from Django settings (module-level import) with fallbacks
         self.chunk_duration = chunk_duration or getattr(settings, 'AUDIO_CHUNK_DURATION', 30.0)
         self.overlap_duration = overlap_duration or getattr(settings, 'AUDIO_OVERLAP_DURATION', 5.0)
         self.max_chunk_duration = max_chunk_duration or getattr(settings, 'AUDIO_MAX_CHUNK_DURATION', 60.0)
         self.min_chunk_duration = min_chunk_duration or getattr(settings, 'AUDIO_MIN_CHUNK_DURATION', 10.0)
         self.max_chunks = getattr(settings, 'AUDIO_MAX_CHUNKS', 150)  # Increased safety limit
         self.max_duration = getattr(settings, 'AUDIO_MAX_DURATION', 7200)  # 2 hours max
-        
+
         logger.debug(f"AudioChunker configured - Duration: {self.chunk_duration}s, "
                     f"Overlap: {self.overlap_duration}s, "
                     f"Range: {self.min_chunk_duration}s-{self.max_chunk_duration}s")
@@ -61,7 +142,24 @@ class AudioChunker:
         # Chunk files larger than the configured threshold (default: 2MB)
         chunk_threshold = getattr(settings, 'AUDIO_CHUNK_THRESHOLD', 2 * 1024 * 1024)
         return file_size > chunk_threshold
-    
+
+    def should_chunk_duration(self, duration: float) -> bool:
+        """
+        Determine if a file should be chunked based on duration
+
+        File size is a poor proxy for length (a voice-only Opus file can be
+        30+ minutes at a few MB, a short WAV can be 10MB), so the final gate
+        is duration: anything that fits roughly one chunk window is
+        transcribed whole.
+
+        Args:
+            duration: Audio duration in seconds
+
+        Returns:
+            True if file should be chunked
+        """
+        return duration > self.chunk_duration * 1.2
+
     def get_audio_duration(self, audio_path: str) -> float:
         """
         Get audio duration in seconds with enhanced reliability
@@ -72,57 +170,38 @@ class AudioChunker:
         Returns:
             Duration in seconds
         """
-        # Try multiple methods for maximum reliability
+        # Stat once and key the cached probes by (path, size, mtime) so
+        # repeat lookups — VAD chunking, the time-based fallback, the final
+        # duration persist — are dict hits instead of subprocess spawns
+        try:
+            stat = os.stat(audio_path)
+        except OSError as e:
+            logger.error(f"Cannot stat audio file {audio_path}: {e}")
+            return 0.0
+
+        # Header-only methods, cheapest first: soundfile and torchaudio
+        # parse headers, ffprobe probes the container. No full-decode
+        # fallback — callers that need one should use
+        # get_audio_duration_with_fallback, which estimates from file size
         methods = [
-            ("torchaudio", self._get_duration_torchaudio),
-            ("pydub", self._get_duration_pydub),
-            ("ffprobe", self._get_duration_ffprobe)
+            ("soundfile", _probe_duration_soundfile),
+            ("torchaudio", _probe_duration_torchaudio),
+            ("ffprobe", _probe_duration_ffprobe)
         ]
-        
+
         for method_name, method_func in methods:
             try:
-                duration = method_func(audio_path)
+                duration = method_func(audio_path, stat.st_size, stat.st_mtime_ns)
                 if duration > 0:
-                    logger.info(f"Audio duration detected via {method_name}: {duration:.2f} seconds")
+                    logger.debug("Audio duration detected via %s: %.2f seconds", method_name, duration)
                     return duration
             except Exception as e:
                 logger.warning(f"Duration detection failed with {method_name}: {e}")
                 continue
-        
+
         logger.error(f"All duration detection methods failed for: {audio_path}")
         return 0.0
-    
-    def _get_duration_torchaudio(self, audio_path: str) -> float:
-        """Get duration using torchaudio (most reliable for various formats)"""
-        info = torchaudio.info(audio_path)
-        return info.num_frames / info.sample_rate
-    
-    def _get_duration_pydub(self, audio_path: str) -> float:
-        """Get duration using pydub (good fallback)"""
-        audio = AudioSegment.from_file(audio_path)
-        return len(audio) / 1000.0  # Convert ms to seconds
-    
-    def _get_duration_ffprobe(self, audio_path: str) -> float:
-        """Get duration using ffprobe command (most comprehensive)"""
-        import subprocess
-        import json
-        
-        cmd = [
-            'ffprobe', '-v', 'quiet', '-print_format', 'json',
-            '-show_format', audio_path
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-        if result.returncode != 0:
-            raise Exception(f"ffprobe failed: {result.stderr}")
-        
-        data = json.loads(result.stdout)
-        duration_str = data.get('format', {}).get('duration')
-        if duration_str:
-            return float(duration_str)
-        
-        raise Exception("Duration not found in ffprobe output")
-    
+
     def estimate_duration_from_file_size(self, file_size: int, file_extension: str) -> float:
         """
         Estimate audio duration from file size using format-aware compression ratios
@@ -134,20 +213,9 @@ class AudioChunker:
         Returns:
             Estimated duration in seconds
         """
-        # Format-specific compression ratios (MB per minute)
-        # Adjusted to more conservative estimates for typical user uploads
-        compression_ratios = {
-            '.mp3': 1.0,    # ~1MB per minute (more conservative for typical MP3s)
-            '.wav': 10.0,   # Uncompressed WAV
-            '.m4a': 0.5,    # ~0.5MB per minute (conservative M4A/AAC)
-            '.mp4': 0.8,    # ~0.8MB per minute (MP4 audio)
-            '.flac': 5.0,   # Lossless compression
-            '.ogg': 0.8,    # ~0.8MB per minute OGG Vorbis
-            '.aac': 0.5,    # ~0.5MB per minute AAC
-        }
-        
-        # Default to MP3 ratio if format unknown
-        mb_per_minute = compression_ratios.get(file_extension.lower(), 1.0)
+        # Default to MP3 ratio if format unknown; tolerate a missing dot
+        file_extension = '.' + file_extension.lstrip('.').lower()
+        mb_per_minute = _COMPRESSION_RATIOS.get(file_extension, 1.0)
         
         # Calculate estimated duration
         file_size_mb = file_size / (1024 * 1024)
@@ -196,49 +264,60 @@ class AudioChunker:
         """
         try:
             logger.info("Attempting VAD-aware chunking")
-            
-            # Get speech segments using existing VAD detection
-            speech_segments = detect_speech_segments(audio_path)
-            
-            if not speech_segments or len(speech_segments) == 1:
+
+            # Get speech segments using existing VAD detection, memoized by
+            # file content version so retries skip the full-decode VAD pass
+            stat = os.stat(audio_path)
+            speech_segments = _cached_speech_segments(audio_path, stat.st_size, stat.st_mtime_ns)
+
+            if (not speech_segments or len(speech_segments) == 1 or
+                    any(end is None for _, end in speech_segments)):
                 logger.info("VAD detection failed or found single segment, falling back to time-based")
                 return self.create_time_based_chunks(audio_path)
-            
-            chunks = []
-            current_chunk_start = 0.0
-            current_chunk_duration = 0.0
-            
-            for start, end in speech_segments:
-                # Check if we've reached chunk limit
-                if len(chunks) >= self.max_chunks:
-                    logger.warning(f"Reached maximum chunk limit of {self.max_chunks} during VAD chunking")
-                    break
-                
-                segment_duration = end - start if end else self.chunk_duration
-                
-                # If adding this segment would exceed chunk duration, finalize current chunk
-                if (current_chunk_duration + segment_duration > self.chunk_duration and 
-                    current_chunk_duration >= self.min_chunk_duration):
-                    
-                    # Add overlap to the end
-                    chunk_end = min(start + self.overlap_duration, end if end else start + segment_duration)
-                    chunks.append((current_chunk_start, chunk_end))
-                    
-                    # Start new chunk with overlap
-                    current_chunk_start = max(0, start - self.overlap_duration)
-                    current_chunk_duration = segment_duration + self.overlap_duration
-                else:
-                    # Add segment to current chunk
-                    current_chunk_duration += segment_duration
-            
-            # Add final chunk if there's remaining content
-            if current_chunk_duration >= self.min_chunk_duration:
-                audio_duration = self.get_audio_duration(audio_path)
-                chunks.append((current_chunk_start, audio_duration))
-            
+
+            # Vectorized boundary search: accumulate speech time with a
+            # cumulative sum and locate where each chunk_duration worth of
+            # speech ends, instead of branching per segment in Python
+            segments = np.asarray(speech_segments, dtype=np.float64)
+            durations = segments[:, 1] - segments[:, 0]
+            cumulative = np.cumsum(durations)
+            total_speech = cumulative[-1]
+
+            # Segment indices where accumulated speech crosses each chunk target
+            targets = np.arange(self.chunk_duration, total_speech, self.chunk_duration)
+            boundaries = np.unique(np.searchsorted(cumulative, targets))
+            boundaries = boundaries[boundaries < len(segments) - 1]
+
+            # Chunk i covers segments start_idx[i]..end_idx[i] inclusive
+            end_idx = np.append(boundaries, len(segments) - 1)
+            start_idx = np.concatenate(([0], boundaries + 1))
+
+            chunk_starts = segments[start_idx, 0]
+            chunk_ends = segments[end_idx, 1]
+
+            # Pad boundaries with overlap so speech at a cut is transcribed
+            # in both neighbouring chunks
+            audio_duration = self.get_audio_duration(audio_path)
+            chunk_starts = np.maximum(chunk_starts - self.overlap_duration, 0.0)
+            chunk_starts[0] = max(chunk_starts[0], 0.0)
+            if audio_duration > 0:
+                chunk_ends = np.minimum(chunk_ends + self.overlap_duration, audio_duration)
+
+            chunks = list(zip(chunk_starts.tolist(), chunk_ends.tolist()))
+
+            # Merge a too-small final chunk into its predecessor
+            if len(chunks) > 1 and (chunks[-1][1] - chunks[-1][0]) < self.min_chunk_duration:
+                chunks[-2] = (chunks[-2][0], chunks[-1][1])
+                chunks.pop()
+
+            # Enforce the chunk safety limit
+            if len(chunks) > self.max_chunks:
+                logger.warning(f"Reached maximum chunk limit of {self.max_chunks} during VAD chunking")
+                chunks = chunks[:self.max_chunks]
+
             logger.info(f"VAD-aware chunking created {len(chunks)} chunks")
             return chunks
-            
+
         except Exception as e:
             logger.warning(f"VAD-aware chunking failed: {e}, falling back to time-based")
             return self.create_time_based_chunks(audio_path)
@@ -264,29 +343,28 @@ class AudioChunker:
             
             if audio_duration <= self.chunk_duration:
                 return [(0.0, audio_duration)]
-            
-            chunks = []
-            current_start = 0.0
-            
-            while current_start < audio_duration and len(chunks) < self.max_chunks:
-                chunk_end = min(current_start + self.chunk_duration, audio_duration)
-                chunks.append((current_start, chunk_end))
-                
-                # Next chunk starts with overlap
-                current_start += self.chunk_duration - self.overlap_duration
-                
-                # Avoid very small final chunks
-                if audio_duration - current_start < self.min_chunk_duration:
-                    # Extend the last chunk to include remaining audio
-                    if chunks:
-                        chunks[-1] = (chunks[-1][0], audio_duration)
-                    break
-            
+
+            # Vectorized boundary math: starts advance by the overlap
+            # stride, ends are clamped to the audio duration
+            stride = self.chunk_duration - self.overlap_duration
+            if stride <= 0:
+                stride = self.chunk_duration
+
+            starts = np.arange(0.0, audio_duration, stride)[:self.max_chunks]
+            ends = np.minimum(starts + self.chunk_duration, audio_duration)
+
+            # Avoid very small final chunks by merging them into the
+            # previous one
+            if len(starts) > 1 and ends[-1] - starts[-1] < self.min_chunk_duration:
+                ends[-2] = ends[-1]
+                starts, ends = starts[:-1], ends[:-1]
+
             # Log warning if we hit chunk limit
-            if len(chunks) >= self.max_chunks:
+            if len(starts) >= self.max_chunks:
                 logger.warning(f"Reached maximum chunk limit of {self.max_chunks}. "
-                              f"Remaining audio duration: {audio_duration - current_start:.1f}s")
-            
+                              f"Remaining audio duration: {audio_duration - ends[-1]:.1f}s")
+
+            chunks = list(zip(starts.tolist(), ends.tolist()))
             logger.info(f"Time-based chunking created {len(chunks)} chunks")
             return chunks
             
@@ -298,47 +376,349 @@ class AudioChunker:
                         output_path: str) -> bool:
         """
         Save a chunk of audio to a separate file
-        
+
+        The output directory must already exist (created once by
+        _plan_chunk_exports rather than per chunk).
+
         Args:
             audio_path: Source audio file path
             start_time: Start time in seconds
             end_time: End time in seconds
             output_path: Output file path
-            
+
         Returns:
             True if successful
         """
         try:
-            # Use pydub for reliable chunking across formats
-            audio = AudioSegment.from_file(audio_path)
-            
-            # Convert seconds to milliseconds
-            start_ms = int(start_time * 1000)
-            end_ms = int(end_time * 1000)
-            
-            # Extract chunk
-            chunk = audio[start_ms:end_ms]
-            
-            # Ensure output directory exists
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
+            # Prefer ffmpeg with input seeking: only the requested span is
+            # decoded, instead of pydub's full-file decode per chunk
+            if self._extract_chunk_ffmpeg(audio_path, start_time, end_time, output_path):
+                logger.debug("Saved chunk: %.1fs-%.1fs to %s", start_time, end_time, output_path)
+                return True
+
+            # Second choice: soundfile seeks to the requested frames, so
+            # resident memory stays O(chunk_duration) not O(file_duration)
+            if self._extract_chunk_soundfile(audio_path, start_time, end_time, output_path):
+                logger.debug("Saved chunk via soundfile: %.1fs-%.1fs to %s", start_time, end_time, output_path)
+                return True
+
+            # Fallback: pydub, but seek and limit on the ffmpeg input side
+            # so only the requested span is decoded rather than the whole
+            # file being decoded and sliced in memory
+            chunk = AudioSegment.from_file(
+                audio_path,
+                parameters=['-ss', f'{start_time:.3f}', '-to', f'{end_time:.3f}']
+            )
+
             # Export chunk (maintain original format when possible)
             chunk.export(output_path, format="wav")  # WAV for reliability
-            
-            logger.info(f"Saved chunk: {start_time:.1f}s-{end_time:.1f}s to {output_path}")
+
+            logger.debug("Saved chunk via pydub fallback: %.1fs-%.1fs to %s", start_time, end_time, output_path)
             return True
-            
+
         except Exception as e:
             logger.error(f"Failed to save audio chunk: {e}")
             return False
+
+    def _load_waveform(self, audio_path: str):
+        """
+        Decode the whole file into memory once for in-memory slicing
+
+        Args:
+            audio_path: Source audio file path
+
+        Returns:
+            (waveform, sample_rate) tuple, or None if the file exceeds the
+            in-memory decode budget or decoding fails
+        """
+        budget = getattr(settings, 'AUDIO_IN_MEMORY_DECODE_BUDGET', 1024 ** 3)  # 1 GiB
+
+        try:
+            info = torchaudio.info(audio_path)
+            # torchaudio.load decodes to float32 (4 bytes per sample)
+            estimated_bytes = info.num_frames * info.num_channels * 4
+            if estimated_bytes > budget:
+                logger.info(f"Decoded size ~{estimated_bytes / 1024**2:.0f}MB exceeds in-memory "
+                            f"budget, using per-chunk extraction")
+                return None
+
+            waveform, sample_rate = torchaudio.load(audio_path)
+
+            # Downmix and resample once here so every slice is written in
+            # Whisper's expected 16kHz mono format
+            if waveform.shape[0] > 1:
+                waveform = waveform.mean(dim=0, keepdim=True)
+            if sample_rate != 16000:
+                waveform = torchaudio.functional.resample(waveform, sample_rate, 16000)
+                sample_rate = 16000
+
+            return waveform, sample_rate
+
+        except Exception as e:
+            logger.warning(f"In-memory decode failed, using per-chunk extraction: {e}")
+            return None
+
+    def _save_slice(self, waveform, sample_rate: int, start_time: float,
+                    end_time: float, output_path: str) -> bool:
+        """
+        Write one chunk from an already-decoded waveform
+
+        The output directory must already exist (created once by
+        _plan_chunk_exports rather than per chunk).
+
+        Args:
+            waveform: Decoded audio tensor (channels, frames)
+            sample_rate: Sample rate of the waveform
+            start_time: Start time in seconds
+            end_time: End time in seconds
+            output_path: Output file path
+
+        Returns:
+            True if successful
+        """
+        try:
+            start_frame = int(start_time * sample_rate)
+            end_frame = min(int(end_time * sample_rate), waveform.shape[1])
+
+            torchaudio.save(
+                output_path, waveform[:, start_frame:end_frame], sample_rate,
+                encoding='PCM_S', bits_per_sample=16
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to save audio slice: {e}")
+            return False
+
+    def _extract_chunk_soundfile(self, audio_path: str, start_time: float, end_time: float,
+                                 output_path: str) -> bool:
+        """
+        Extract a chunk by seeking with soundfile (WAV/FLAC, no full decode)
+
+        Args:
+            audio_path: Source audio file path
+            start_time: Start time in seconds
+            end_time: End time in seconds
+            output_path: Output file path
+
+        Returns:
+            True if soundfile extraction succeeded
+        """
+        if not SOUNDFILE_AVAILABLE:
+            return False
+
+        try:
+            info = soundfile.info(audio_path)
+            start_frame = int(start_time * info.samplerate)
+            stop_frame = min(int(end_time * info.samplerate), info.frames)
+
+            data, sample_rate = soundfile.read(
+                audio_path, start=start_frame, stop=stop_frame, dtype='int16'
+            )
+            soundfile.write(output_path, data, sample_rate, subtype='PCM_16')
+            return True
+
+        except Exception as e:
+            logger.warning(f"soundfile chunk extraction failed: {e}")
+            return False
+
+    def _extract_chunk_ffmpeg(self, audio_path: str, start_time: float, end_time: float,
+                              output_path: str) -> bool:
+        """
+        Extract a chunk using ffmpeg input seeking (decodes only the span)
+
+        Args:
+            audio_path: Source audio file path
+            start_time: Start time in seconds
+            end_time: End time in seconds
+            output_path: Output file path
+
+        Returns:
+            True if ffmpeg extraction succeeded
+        """
+        import subprocess
+
+        try:
+            # Encode the requested span straight to Whisper's expected
+            # input format (16kHz mono s16le): chunk files shrink ~6x for
+            # typical 44.1kHz stereo sources and skip a downstream resample
+            cmd = [
+                'ffmpeg', '-nostdin', '-y', '-v', 'error',
+                '-ss', f'{start_time:.3f}',
+                '-i', audio_path,
+                '-t', f'{end_time - start_time:.3f}',
+                '-ar', '16000', '-ac', '1', '-acodec', 'pcm_s16le',
+                output_path
+            ]
+
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            if result.returncode != 0:
+                logger.warning(f"ffmpeg chunk extraction failed: {result.stderr.strip()}")
+                return False
+
+            try:
+                return os.stat(output_path).st_size > 0
+            except OSError:
+                return False
+
+        except FileNotFoundError:
+            logger.warning("ffmpeg not available, falling back to pydub")
+            return False
+        except Exception as e:
+            logger.warning(f"ffmpeg chunk extraction error: {e}")
+            return False
     
+    def _plan_chunk_exports(self, audio_path: str, meeting: Meeting) -> List[Tuple[int, float, float, str]]:
+        """
+        Plan the chunk export tasks for a meeting's audio file
+
+        Args:
+            audio_path: Source audio file path
+            meeting: Meeting instance
+
+        Returns:
+            List of (chunk_index, start_time, end_time, chunk_path) tuples
+        """
+        # Duration gate before any VAD: file size is a poor proxy for
+        # length, and a file that fits roughly one chunk window needs no
+        # boundary search — emit a single whole-file chunk
+        duration = meeting.duration or self.get_audio_duration_with_fallback(
+            audio_path, meeting.file_size or 0)
+        if duration > 0 and not self.should_chunk_duration(duration):
+            logger.info(f"Duration {duration:.1f}s fits a single window, skipping VAD")
+            chunk_segments = [(0.0, duration)]
+        else:
+            # Create chunk time segments using VAD-aware method
+            chunk_segments = self.create_vad_aware_chunks(audio_path, meeting)
+
+        # Create the chunk directory once here so the per-chunk writers
+        # don't pay makedirs stat syscalls on every call
+        chunk_dir = os.path.join(os.path.dirname(audio_path), "chunks")
+        os.makedirs(chunk_dir, exist_ok=True)
+
+        chunk_prefix = os.path.join(chunk_dir, "chunk_")
+        export_tasks = []
+        for idx, (start_time, end_time) in enumerate(chunk_segments):
+            chunk_path = f"{chunk_prefix}{idx:03d}_{start_time:.1f}s-{end_time:.1f}s.wav"
+            export_tasks.append((idx, start_time, end_time, chunk_path))
+
+        return export_tasks
+
+    def _export_chunks(self, audio_path: str,
+                       export_tasks: List[Tuple[int, float, float, str]]) -> Dict[int, Tuple[float, float, str]]:
+        """
+        Fan out the chunk exports across a bounded thread pool
+
+        Args:
+            audio_path: Source audio file path
+            export_tasks: Planned export tasks from _plan_chunk_exports
+
+        Returns:
+            Mapping of chunk_index -> (start_time, end_time, chunk_path)
+            for chunks that exported successfully
+        """
+        # Decode once and slice in memory when the file fits the budget:
+        # one decode plus N tensor slices instead of N seek-and-decode
+        # subprocess spawns
+        decoded = self._load_waveform(audio_path)
+        if decoded is not None:
+            waveform, sample_rate = decoded
+            saved_chunks = {}
+            for idx, start_time, end_time, chunk_path in export_tasks:
+                if self._save_slice(waveform, sample_rate, start_time, end_time, chunk_path):
+                    saved_chunks[idx] = (start_time, end_time, chunk_path)
+                else:
+                    logger.error(f"Failed to save chunk {idx}")
+            return saved_chunks
+
+        # Each export is an independent ffmpeg subprocess, so a bounded
+        # thread pool overlaps their decode and disk I/O latency. Worker
+        # count caps concurrent ffmpeg processes to avoid saturating disk
+        # bandwidth; shared hosts can lower it via AUDIO_CHUNK_WORKERS.
+        worker_cap = getattr(settings, 'AUDIO_CHUNK_WORKERS', 8)
+        max_workers = min(os.cpu_count() or 2, worker_cap, len(export_tasks))
+        saved_chunks = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_task = {
+                executor.submit(self.save_audio_chunk, audio_path, start_time, end_time, chunk_path): (idx, start_time, end_time, chunk_path)
+                for idx, start_time, end_time, chunk_path in export_tasks
+            }
+
+            for future in as_completed(future_to_task):
+                idx, start_time, end_time, chunk_path = future_to_task[future]
+                try:
+                    if future.result():
+                        saved_chunks[idx] = (start_time, end_time, chunk_path)
+                    else:
+                        logger.error(f"Failed to save chunk {idx}")
+                except Exception as e:
+                    logger.error(f"Failed to save chunk {idx}: {e}")
+
+        return saved_chunks
+
+    def _finalize_chunks(self, meeting: Meeting,
+                         saved_chunks: Dict[int, Tuple[float, float, str]]) -> List[AudioChunk]:
+        """
+        Persist exported chunks and hand them to the transcription queue
+
+        Args:
+            meeting: Meeting instance
+            saved_chunks: Successful exports from _export_chunks
+
+        Returns:
+            List of created AudioChunk instances
+        """
+        # Collect AudioChunk instances in index order for one bulk insert
+        chunk_instances = []
+        for idx in sorted(saved_chunks):
+            start_time, end_time, chunk_path = saved_chunks[idx]
+
+            # Get chunk file size with one stat syscall
+            try:
+                chunk_size = os.stat(chunk_path).st_size
+            except OSError:
+                chunk_size = 0
+
+            chunk_instances.append(AudioChunk(
+                meeting=meeting,
+                chunk_index=idx,
+                start_time=start_time,
+                end_time=end_time,
+                duration=end_time - start_time,
+                file_path=chunk_path,
+                file_size=chunk_size,
+                status='pending'
+            ))
+
+            logger.debug("Created chunk %d: %.1fs-%.1fs", idx, start_time, end_time)
+
+        # Insert all chunk records in a single transaction instead of
+        # one INSERT round-trip per chunk
+        with transaction.atomic():
+            created_chunks = AudioChunk.objects.bulk_create(chunk_instances, batch_size=200)
+
+        # Hand all created chunks to the transcription queue in one batch
+        try:
+            from .progressive_transcription import add_chunks_to_transcription_queue
+            add_chunks_to_transcription_queue(created_chunks)
+            logger.debug("Added %d chunks to transcription queue", len(created_chunks))
+        except Exception as e:
+            logger.error(f"Failed to add chunks to transcription queue: {e}")
+
+        return created_chunks
+
     def chunk_audio_file(self, meeting: Meeting) -> bool:
         """
         Main method to chunk an audio file for a meeting
-        
+
+        Structured as three phases — plan, parallel export, finalize — so
+        each phase maps onto a task-queue topology (fan-out plus a final
+        aggregation step) if one is introduced later.
+
         Args:
             meeting: Meeting instance with audio file
-            
+
         Returns:
             True if chunking was successful
         """
@@ -346,74 +726,49 @@ class AudioChunker:
             if not meeting.audio_file:
                 logger.error("Meeting has no audio file to chunk")
                 return False
-            
+
             audio_path = meeting.audio_file.path
             if not os.path.exists(audio_path):
                 logger.error(f"Audio file not found: {audio_path}")
                 return False
-            
+
             # Check if chunking is needed
             if not self.should_chunk_file(meeting.file_size or 0):
                 logger.info("File size below chunking threshold, skipping")
                 return True
-            
+
             logger.info(f"Starting chunking for meeting {meeting.id}")
-            
-            # Create chunk time segments using VAD-aware method
-            chunk_segments = self.create_vad_aware_chunks(audio_path, meeting)
-            
-            if not chunk_segments:
+
+            # Persist detected duration on the meeting so later requests can
+            # read it from the DB instead of touching the file again
+            if not meeting.duration:
+                duration = self.get_audio_duration(audio_path)
+                if duration > 0:
+                    meeting.duration = duration
+                    meeting.save(update_fields=['duration'])
+
+            export_tasks = self._plan_chunk_exports(audio_path, meeting)
+
+            if not export_tasks:
                 logger.error("No chunks created")
                 return False
-            
-            # Create AudioChunk records and save chunk files
-            for idx, (start_time, end_time) in enumerate(chunk_segments):
-                # Generate chunk file path
-                chunk_filename = f"chunk_{idx:03d}_{start_time:.1f}s-{end_time:.1f}s.wav"
-                chunk_dir = os.path.join(os.path.dirname(audio_path), "chunks")
-                chunk_path = os.path.join(chunk_dir, chunk_filename)
-                
-                # Save audio chunk
-                if not self.save_audio_chunk(audio_path, start_time, end_time, chunk_path):
-                    logger.error(f"Failed to save chunk {idx}")
-                    continue
-                
-                # Get chunk file size
-                chunk_size = os.path.getsize(chunk_path) if os.path.exists(chunk_path) else 0
-                
-                # Create AudioChunk record
-                chunk = AudioChunk.objects.create(
-                    meeting=meeting,
-                    chunk_index=idx,
-                    start_time=start_time,
-                    end_time=end_time,
-                    duration=end_time - start_time,
-                    file_path=chunk_path,
-                    file_size=chunk_size,
-                    status='pending'
-                )
-                
-                logger.info(f"Created chunk {idx}: {start_time:.1f}s-{end_time:.1f}s")
-                
-                # Add chunk to progressive transcription queue immediately
-                try:
-                    from .progressive_transcription import add_chunk_to_transcription_queue
-                    add_chunk_to_transcription_queue(chunk)
-                    logger.info(f"Added chunk {idx} to transcription queue")
-                except Exception as e:
-                    logger.error(f"Failed to add chunk {idx} to transcription queue: {e}")
-            
-            logger.info(f"Successfully created {len(chunk_segments)} chunks for meeting {meeting.id}")
-            
+
+            export_started = time.monotonic()
+            saved_chunks = self._export_chunks(audio_path, export_tasks)
+            self._finalize_chunks(meeting, saved_chunks)
+
+            logger.info("Created %d chunks for meeting %s in %.2fs",
+                        len(export_tasks), meeting.id, time.monotonic() - export_started)
+
             # Mark chunking as complete for progressive transcription
             try:
                 from .progressive_transcription import mark_chunking_complete
-                mark_chunking_complete(meeting, len(chunk_segments))
+                mark_chunking_complete(meeting, len(export_tasks))
             except Exception as e:
                 logger.error(f"Failed to mark chunking complete: {e}")
-            
+
             return True
-            
+
         except Exception as e:
             logger.error(f"Audio chunking failed: {e}")
             # Also mark chunking complete on failure (with no expected count)
@@ -450,31 +805,18 @@ def cleanup_chunks(meeting: Meeting) -> bool:
         True if successful
     """
     try:
-        chunks = meeting.chunks.all()
-        
-        for chunk in chunks:
-            if chunk.file_path and os.path.exists(chunk.file_path):
-                try:
-                    os.remove(chunk.file_path)
-                    logger.info(f"Removed chunk file: {chunk.file_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to remove chunk file {chunk.file_path}: {e}")
-        
-        # Remove chunk directory if empty
-        if chunks.exists():
-            chunk_dir = os.path.dirname(chunks.first().file_path)
-            if os.path.exists(chunk_dir) and not os.listdir(chunk_dir):
-                try:
-                    os.rmdir(chunk_dir)
-                    logger.info(f"Removed empty chunk directory: {chunk_dir}")
-                except Exception as e:
-                    logger.warning(f"Failed to remove chunk directory: {e}")
-        
-        # Delete chunk records
-        chunks.delete()
-        logger.info(f"Cleaned up chunks for meeting {meeting.id}")
+        # Derive the chunk directory from the meeting's audio path and
+        # remove it in one pass instead of stat+unlink per chunk file
+        if meeting.audio_file:
+            chunk_dir = os.path.join(os.path.dirname(meeting.audio_file.path), "chunks")
+            shutil.rmtree(chunk_dir, ignore_errors=True)
+            logger.info(f"Removed chunk directory: {chunk_dir}")
+
+        # Delete chunk records with a single DELETE statement
+        deleted_count, _ = meeting.chunks.all().delete()
+        logger.info(f"Cleaned up {deleted_count} chunks for meeting {meeting.id}")
         return True
-        
+
     except Exception as e:
         logger.error(f"Failed to cleanup chunks: {e}")
         return False
\ No newline at end of file
@@ -8,13 +8,37 @@ the results into a complete transcript.
 import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from typing import List, Optional
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count
 from django.utils import timezone
 from .models import Meeting, AudioChunk, Transcript
 from .utils import transcribe_audio
 
 logger = logging.getLogger(__name__)
 
+# Shared executor reusing worker threads across chunks instead of paying
+# thread creation + scheduler setup per call. Sized above the transcription
+# concurrency so a timed-out straggler still occupying a worker does not
+# block fresh submissions.
+_timeout_executor = None
+_timeout_executor_lock = threading.Lock()
+
+
+def _get_timeout_executor():
+    global _timeout_executor
+    if _timeout_executor is None:
+        with _timeout_executor_lock:
+            if _timeout_executor is None:
+                _timeout_executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'CHUNK_TRANSCRIPTION_WORKERS', 4) * 2,
+                    thread_name_prefix='chunk-transcribe'
+                )
+    return _timeout_executor
+
 
 def transcribe_audio_with_timeout(audio_path, whisper_model, chunk, language, timeout=300):
     """
@@ -30,33 +54,30 @@ def transcribe_audio_with_timeout(audio_path, whisper_model, chunk, language, ti
     Returns:
         tuple: (success: bool, text: str or None, timed_out: bool)
     """
-    result = [None]
-    exception = [None]
-    
-    def transcribe_worker():
-        try:
-            text = transcribe_audio(audio_path, whisper_model, chunk, language)
-            result[0] = text
-        except Exception as e:
-            exception[0] = e
-    
-    # Start transcription in a separate thread
-    thread = threading.Thread(target=transcribe_worker, daemon=True)
-    thread.start()
-    
-    # Wait for completion or timeout
-    thread.join(timeout=timeout)
-    
-    if thread.is_alive():
+    # Opt-in subprocess isolation: a timed-out job is actually terminated
+    # instead of leaving a ghost thread holding the model and GIL
+    if getattr(settings, 'WHISPER_SUBPROCESS_ISOLATION', False):
+        from .transcription_worker import transcribe_with_isolation
+        return transcribe_with_isolation(audio_path, whisper_model, language, timeout)
+
+    # Submit to the shared executor and wait on the future; the success
+    # path reuses a pooled thread instead of creating and joining one
+    future = _get_timeout_executor().submit(
+        transcribe_audio, audio_path, whisper_model, chunk, language
+    )
+
+    try:
+        text = future.result(timeout=timeout)
+    except FuturesTimeoutError:
+        # The worker keeps running until the job finishes, but the pool
+        # has headroom for stragglers
         logger.error(f"Transcription timed out after {timeout}s for chunk {chunk.chunk_index}")
-        # Thread is still running, mark as timeout
         return (False, None, True)
-    
-    if exception[0]:
-        logger.error(f"Transcription failed for chunk {chunk.chunk_index}: {exception[0]}")
+    except Exception as e:
+        logger.error(f"Transcription failed for chunk {chunk.chunk_index}: {e}")
         return (False, None, False)
-    
-    return (True, result[0], False)
+
+    return (True, text, False)
 
 
 class ChunkTranscriber:
@@ -67,28 +88,31 @@ class ChunkTranscriber:
     def __init__(self):
         self.overlap_threshold = 3.0  # 3 seconds to detect overlap
     
-    def transcribe_chunk(self, chunk: AudioChunk, whisper_model: str = 'large-v2', 
-                        language: Optional[str] = None) -> bool:
+    def transcribe_chunk(self, chunk: AudioChunk, whisper_model: str = 'large-v2',
+                        language: Optional[str] = None, defer_save: bool = False) -> bool:
         """
         Transcribe a single audio chunk
-        
+
         Args:
             chunk: AudioChunk instance to transcribe
             whisper_model: Whisper model to use
             language: Language code (optional)
-            
+            defer_save: Mutate the chunk in memory only, leaving the
+                caller to flush status writes (e.g. via bulk_update)
+
         Returns:
             True if successful
         """
         try:
             chunk.status = 'processing'
-            chunk.save()
-            
+            if not defer_save:
+                chunk.save()
+
             logger.info(f"Starting transcription for chunk {chunk.chunk_index} of meeting {chunk.meeting.id}")
-            
+
             # Transcribe the chunk file with timeout protection (generous for complex audio)
             success, text, timed_out = transcribe_audio_with_timeout(chunk.file_path, whisper_model, chunk, language, timeout=300)
-            
+
             if success and text:
                 chunk.transcript_text = text
                 chunk.status = 'completed'
@@ -102,14 +126,16 @@ class ChunkTranscriber:
                 chunk.status = 'failed'
                 chunk.error_message = "No transcription text generated or error occurred"
                 logger.warning(f"No text generated for chunk {chunk.chunk_index}")
-            
-            chunk.save()
+
+            if not defer_save:
+                chunk.save()
             return chunk.status == 'completed'
-            
+
         except Exception as e:
             chunk.status = 'failed'
             chunk.error_message = str(e)
-            chunk.save()
+            if not defer_save:
+                chunk.save()
             logger.error(f"Transcription failed for chunk {chunk.chunk_index}: {e}")
             return False
     
@@ -128,51 +154,84 @@ class ChunkTranscriber:
         """
         if not previous_text or not current_text or overlap_duration <= 0:
             return current_text
-        
+
         try:
             # Split texts into words
             prev_words = previous_text.strip().split()
             curr_words = current_text.strip().split()
-            
-            if len(prev_words) < 5 or len(curr_words) < 5:
-                return current_text
-            
-            # Estimate overlap based on duration (rough approximation)
-            # Assume average 2-3 words per second
-            estimated_overlap_words = int(overlap_duration * 2.5)
-            
-            if estimated_overlap_words <= 0:
-                return current_text
-            
-            # Look for matching sequences at the end of previous and start of current
-            max_check = min(estimated_overlap_words + 5, len(prev_words) // 2, len(curr_words) // 2)
-            
-            best_match_length = 0
-            for i in range(1, max_check + 1):
-                prev_suffix = prev_words[-i:]
-                curr_prefix = curr_words[:i]
-                
-                # Check for exact match or partial match
-                if prev_suffix == curr_prefix:
-                    best_match_length = i
-                elif len(prev_suffix) == len(curr_prefix):
-                    # Check for partial match (70% similarity)
-                    matches = sum(1 for a, b in zip(prev_suffix, curr_prefix) if a.lower() == b.lower())
-                    if matches / len(prev_suffix) >= 0.7:
-                        best_match_length = i
-            
+
+            overlap = self._count_overlap_words(prev_words, curr_words, overlap_duration)
+
             # Remove overlapping words from current text
-            if best_match_length > 0:
-                remaining_words = curr_words[best_match_length:]
-                result = ' '.join(remaining_words).strip()
-                logger.debug(f"Removed {best_match_length} overlapping words")
-                return result
-            
+            if overlap > 0:
+                logger.debug(f"Removed {overlap} overlapping words")
+                return ' '.join(curr_words[overlap:])
+
             return current_text
-            
+
         except Exception as e:
             logger.warning(f"Failed to remove overlap: {e}")
             return current_text
+
+    def _count_overlap_words(self, prev_words: List[str], curr_words: List[str],
+                             overlap_duration: float) -> int:
+        """
+        Count how many leading words of curr_words repeat the tail of prev_words
+
+        Operates on word lists so reassembly can trim overlaps without
+        round-tripping through joined strings.
+
+        Args:
+            prev_words: Words from the previous chunk
+            curr_words: Words from the current chunk
+            overlap_duration: Overlap duration in seconds
+
+        Returns:
+            Number of overlapping leading words (0 if none detected)
+        """
+        if len(prev_words) < 5 or len(curr_words) < 5:
+            return 0
+
+        # Estimate overlap based on duration (rough approximation)
+        # Assume average 2-3 words per second
+        estimated_overlap_words = int(overlap_duration * 2.5)
+
+        if estimated_overlap_words <= 0:
+            return 0
+
+        # Look for matching sequences at the end of previous and start of current
+        max_check = min(estimated_overlap_words + 5, len(prev_words) // 2, len(curr_words) // 2)
+
+        # Lowercase each comparison window once instead of per pairing
+        prev_tail = [w.lower() for w in prev_words[-max_check:]]
+        curr_head = [w.lower() for w in curr_words[:max_check]]
+
+        # Rolling polynomial hashes: suffix hashes of the previous tail
+        # and prefix hashes of the current head, so every candidate
+        # overlap length is one integer comparison instead of a fresh
+        # slice-and-compare — O(k) rather than O(k^2)
+        base, mod = 1_000_003, (1 << 61) - 1
+        prefix_hashes = [0] * (max_check + 1)
+        suffix_hashes = [0] * (max_check + 1)
+        power = 1
+        for i in range(1, max_check + 1):
+            prefix_hashes[i] = (prefix_hashes[i - 1] * base + hash(curr_head[i - 1])) % mod
+            suffix_hashes[i] = (hash(prev_tail[-i]) * power + suffix_hashes[i - 1]) % mod
+            power = (power * base) % mod
+
+        for i in range(max_check, 0, -1):
+            # Verify on hash equality to rule out collisions
+            if prefix_hashes[i] == suffix_hashes[i] and prev_tail[-i:] == curr_head[:i]:
+                return i
+
+        # No exact boundary: accept the longest window where at least 70%
+        # of aligned tokens agree
+        for i in range(max_check, 0, -1):
+            matches = sum(1 for a, b in zip(prev_tail[-i:], curr_head[:i]) if a == b)
+            if matches / i >= 0.7:
+                return i
+
+        return 0
     
     def reassemble_transcript(self, meeting: Meeting) -> str:
         """
@@ -185,34 +244,57 @@ class ChunkTranscriber:
             Complete transcript text
         """
         try:
-            chunks = meeting.chunks.filter(status='completed').order_by('chunk_index')
-            
-            if not chunks.exists():
+            # Callers that loaded the meeting with
+            # Prefetch('chunks', queryset=AudioChunk.objects.filter(
+            #     status='completed').order_by('chunk_index'),
+            #     to_attr='completed_chunk_list')
+            # hand the list over directly; otherwise materialize the
+            # completed chunks once, ordered by index — the previous chunk
+            # is then a positional lookup instead of a per-iteration
+            # filter().first() query
+            chunks_list = getattr(meeting, 'completed_chunk_list', None)
+            if chunks_list is None:
+                chunks_list = list(
+                    meeting.chunks.filter(status='completed')
+                    .only('chunk_index', 'transcript_text', 'start_time', 'end_time')
+                    .order_by('chunk_index')
+                )
+
+            if not chunks_list:
                 logger.warning(f"No completed chunks found for meeting {meeting.id}")
                 return ""
-            
-            transcript_parts = []
-            previous_text = ""
-            
-            for chunk in chunks:
+
+            # Accumulate words into one flat list and join exactly once at
+            # the end — overlap trimming stays a list slice, avoiding the
+            # per-chunk join/strip round-trips
+            all_words = []
+            prev_words = None
+
+            for i, chunk in enumerate(chunks_list):
                 if not chunk.transcript_text:
                     continue
-                
-                current_text = chunk.transcript_text.strip()
-                
-                if previous_text and chunk.chunk_index > 0:
-                    # Calculate overlap duration between this chunk and previous
-                    prev_chunk = chunks.filter(chunk_index=chunk.chunk_index - 1).first()
-                    if prev_chunk:
+
+                curr_words = chunk.transcript_text.split()
+                if not curr_words:
+                    continue
+
+                if prev_words and i > 0:
+                    # Overlap removal only applies between adjacent chunks
+                    prev_chunk = chunks_list[i - 1]
+                    if prev_chunk.chunk_index == chunk.chunk_index - 1:
                         overlap_duration = max(0, prev_chunk.end_time - chunk.start_time)
-                        current_text = self.remove_overlap_text(previous_text, current_text, overlap_duration)
-                
-                if current_text:
-                    transcript_parts.append(current_text)
-                    previous_text = current_text
-            
-            complete_transcript = ' '.join(transcript_parts)
-            logger.info(f"Reassembled transcript with {len(chunks)} chunks, total length: {len(complete_transcript)} characters")
+                        if overlap_duration > 0:
+                            overlap = self._count_overlap_words(prev_words, curr_words, overlap_duration)
+                            if overlap > 0:
+                                logger.debug(f"Removed {overlap} overlapping words")
+                                curr_words = curr_words[overlap:]
+
+                if curr_words:
+                    all_words.extend(curr_words)
+                    prev_words = curr_words
+
+            complete_transcript = ' '.join(all_words)
+            logger.info(f"Reassembled transcript with {len(chunks_list)} chunks, total length: {len(complete_transcript)} characters")
             
             return complete_transcript
             
@@ -232,8 +314,14 @@ class ChunkTranscriber:
         """
         try:
             chunks = meeting.chunks.all()
-            
-            if not chunks.exists():
+
+            # One GROUP BY status — a single index scan yields every count
+            counts = dict(
+                chunks.values_list('status').annotate(c=Count('id'))
+            )
+            total = sum(counts.values())
+
+            if not total:
                 # No chunks, use regular transcript progress
                 transcript = meeting.transcript
                 return {
@@ -244,12 +332,12 @@ class ChunkTranscriber:
                     'chunks_processing': 0,
                     'chunks_failed': 0
                 }
-            
-            total_chunks = chunks.count()
-            completed_chunks = chunks.filter(status='completed').count()
-            processing_chunks = chunks.filter(status='processing').count()
-            failed_chunks = chunks.filter(status='failed').count()
-            
+
+            total_chunks = total
+            completed_chunks = counts.get('completed', 0)
+            processing_chunks = counts.get('processing', 0)
+            failed_chunks = counts.get('failed', 0)
+
             # Calculate overall progress
             overall_progress = int((completed_chunks / total_chunks) * 100) if total_chunks > 0 else 0
             
@@ -272,14 +360,18 @@ class ChunkTranscriber:
                 'chunks_failed': failed_chunks,
                 'chunk_details': [
                     {
-                        'index': chunk.chunk_index,
-                        'status': chunk.status,
-                        'progress': chunk.progress,
-                        'start_time': chunk.start_time,
-                        'end_time': chunk.end_time,
-                        'duration': chunk.duration
+                        'index': row['chunk_index'],
+                        'status': row['status'],
+                        'progress': row['progress'],
+                        'start_time': row['start_time'],
+                        'end_time': row['end_time'],
+                        'duration': row['duration']
                     }
-                    for chunk in chunks.order_by('chunk_index')
+                    # values() skips model instance construction for what is
+                    # a plain serialization pass
+                    for row in chunks.order_by('chunk_index').values(
+                        'chunk_index', 'status', 'progress',
+                        'start_time', 'end_time', 'duration')
                 ]
             }
             
@@ -313,35 +405,49 @@ def transcribe_meeting_chunks(meeting: Meeting, whisper_model: str = 'large-v2',
             return True
         
         transcriber = ChunkTranscriber()
-        
-        # Process chunks in parallel (limit concurrent threads)
-        max_workers = min(4, chunks.count())  # Limit to 4 concurrent transcriptions
-        success_count = 0
-        
-        def transcribe_worker(chunk):
-            nonlocal success_count
-            if transcriber.transcribe_chunk(chunk, whisper_model, language):
-                success_count += 1
-        
-        threads = []
+
+        # Preload the model once so worker threads share the cached
+        # instance instead of racing to load their own copies
+        try:
+            from .utils import get_or_create_whisper_model
+            get_or_create_whisper_model(whisper_model)
+        except Exception as e:
+            logger.warning(f"Model preload failed, workers will load on demand: {e}")
+
+        # Process chunks through a shared executor: a freed worker picks up
+        # the next chunk immediately instead of idling at a batch barrier
+        # while a slow chunk finishes
         chunk_list = list(chunks)
-        
-        # Process in batches to avoid overwhelming the system
-        batch_size = max_workers
-        for i in range(0, len(chunk_list), batch_size):
-            batch = chunk_list[i:i + batch_size]
-            batch_threads = []
-            
-            for chunk in batch:
-                thread = threading.Thread(target=transcribe_worker, args=(chunk,))
-                thread.start()
-                batch_threads.append(thread)
-            
-            # Wait for batch to complete
-            for thread in batch_threads:
-                thread.join()
-            
-            threads.extend(batch_threads)
+        max_workers = min(getattr(settings, 'CHUNK_TRANSCRIPTION_WORKERS', 4), len(chunk_list))
+        success_count = 0
+
+        # Flip every chunk to processing with one UPDATE instead of a
+        # write per worker
+        AudioChunk.objects.filter(id__in=[c.id for c in chunk_list]).update(status='processing')
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(transcriber.transcribe_chunk, chunk, whisper_model,
+                                language, True): chunk
+                for chunk in chunk_list
+            }
+
+            # Counting in the main thread keeps success_count race-free
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    if future.result():
+                        success_count += 1
+                except Exception as e:
+                    logger.error(f"Chunk {chunk.chunk_index} transcription raised: {e}")
+
+        # Workers deferred their saves; flush all final chunk states in
+        # one statement
+        with transaction.atomic():
+            AudioChunk.bulk_update_progress(
+                chunk_list,
+                fields=('status', 'transcript_text', 'progress', 'error_message')
+            )
         
         # Update meeting transcript with reassembled text
         if success_count > 0:
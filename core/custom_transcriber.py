@@ -5,17 +5,89 @@ Implements external transcription using custom API endpoints.
 Provides a flexible interface for integrating with any compatible transcription API.
 """
 
+import hashlib
 import logging
+import mimetypes
+import os
+import re
 import requests
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from django.conf import settings
+from django.core.cache import cache
 from .external_transcribers import ExternalAPITranscriber, TranscriptionResult
 
+# httpx is optional: when present, every chunk of a meeting reuses one
+# keep-alive connection pool (HTTP/2 multiplexed when the h2 extra is
+# installed) instead of paying a TCP+TLS handshake per upload
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# requests reads the whole file into memory to build a multipart body;
+# the toolbelt encoder streams it in 8KB reads instead
+try:
+    from requests_toolbelt import MultipartEncoder
+    REQUESTS_TOOLBELT_AVAILABLE = True
+except ImportError:
+    REQUESTS_TOOLBELT_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# orjson is optional: custom API responses can carry full word timestamp
+# arrays, where its C decoder beats the stdlib json used by response.json()
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Content-addressed response cache TTL: identical audio sent to the same
+# model never re-bills the API within this window
+_RESPONSE_CACHE_TTL = getattr(settings, 'TRANSCRIPTION_CACHE_TTL', 7 * 24 * 3600)
+
+
+# Counts words without materializing the O(words) list that text.split()
+# allocates — transcripts for long meetings can run to megabytes
+_WORD_RE = re.compile(r'\S+')
+
+
+def _count_words(text):
+    """Count whitespace-separated tokens without building a list"""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+def _dig(data, path):
+    """Follow a key/index path into nested dicts/lists, None if any step fails"""
+    for key in path:
+        if isinstance(data, dict):
+            data = data.get(key)
+        elif isinstance(data, list) and isinstance(key, int) and key < len(data):
+            data = data[key]
+        else:
+            return None
+    return data
+
 
 class CustomAPITranscriber(ExternalAPITranscriber):
     """Custom API endpoint transcription implementation"""
-    
+
+    # Known response shapes, tried in order; one table-driven pass replaces
+    # the previous chain of nested in/elif checks on every chunk response
+    _TEXT_PATHS = (
+        ('text',),
+        ('transcript',),
+        ('transcription',),
+        ('results', 0, 'text'),
+        ('results', 0, 'transcript'),
+        ('results', 'text'),
+        ('results', 'transcript'),
+        ('choices', 0, 'text'),
+    )
+    _CONFIDENCE_PATHS = (('confidence',), ('score',), ('accuracy',))
+    _LANGUAGE_PATHS = (('language',), ('detected_language',), ('language_code',))
+
     def configure_provider(self):
         """Configure custom API-specific settings"""
         # Use the custom endpoint from meeting configuration
@@ -28,10 +100,106 @@ class CustomAPITranscriber(ExternalAPITranscriber):
         # Custom API configuration (can be extended)
         self.custom_headers = {}
         self.custom_params = {}
-    
+
+        # Resolve the per-request header and form-field dicts once; the
+        # hot path copies these instead of rebuilding them per chunk
+        self._rebuild_request_templates()
+
+        # Pooled keep-alive client shared by all requests to this endpoint
+        # when httpx is installed; the base class falls back to per-request
+        # requests.post otherwise
+        self.http_client = None
+        if HTTPX_AVAILABLE:
+            limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+            try:
+                self.http_client = httpx.Client(http2=True, limits=limits, timeout=self.timeout)
+            except ImportError:
+                # h2 extra not installed; keep-alive pooling alone still
+                # amortizes the handshakes
+                self.http_client = httpx.Client(limits=limits, timeout=self.timeout)
+
+    def __del__(self):
+        """Release pooled connections when the transcriber is dropped"""
+        try:
+            if self.http_client is not None:
+                self.http_client.close()
+        except Exception:
+            pass
+
     def _get_default_model(self) -> str:
         """Get default model for custom API"""
         return "custom"
+
+    def _rebuild_request_templates(self):
+        """Recompute the cached header and form-field dicts
+
+        Called at configure time and whenever custom headers/params
+        change, so _prepare_request_data only copies finished dicts.
+        """
+        self._base_headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            **self.custom_headers
+        }
+        self._fields_template = {
+            "model": self.api_model,
+            **{key: str(value) for key, value in self.custom_params.items()}
+        }
+
+    def _response_cache_key(self, audio_file_path: str) -> Optional[str]:
+        """
+        Build a content-addressed cache key for a transcription request
+
+        Keyed by SHA-256 of the audio bytes plus the model so replays of
+        failed chunks or re-processed meetings hit the cache instead of
+        re-billing the API.
+
+        Args:
+            audio_file_path: Path to audio file
+
+        Returns:
+            Cache key string, or None if the file could not be hashed
+        """
+        try:
+            digest = hashlib.sha256()
+            with open(audio_file_path, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(block)
+            return f"tx:{digest.hexdigest()}:{self.api_model}"
+        except OSError as e:
+            logger.warning(f"Could not hash audio for response cache: {e}")
+            return None
+
+    def transcribe_file(self, audio_file_path: str, language: str = None, **kwargs) -> TranscriptionResult:
+        """
+        Transcribe with a content-addressed response cache in front
+
+        Args:
+            audio_file_path: Path to audio file
+            language: Language code (optional)
+            **kwargs: Additional transcription parameters
+
+        Returns:
+            TranscriptionResult object
+        """
+        cache_key = self._response_cache_key(audio_file_path)
+
+        if cache_key:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.info("Transcription cache hit, skipping API call")
+                return TranscriptionResult(**cached)
+
+        result = super().transcribe_file(audio_file_path, language, **kwargs)
+
+        if cache_key and result and result.text:
+            cache.set(cache_key, {
+                'text': result.text,
+                'confidence': result.confidence,
+                'language': result.language,
+                'word_count': result.word_count,
+            }, timeout=_RESPONSE_CACHE_TTL)
+
+        return result
     
     def _get_max_file_size(self) -> int:
         """Default file size limit for custom APIs (can be overridden)"""
@@ -52,29 +220,34 @@ class CustomAPITranscriber(ExternalAPITranscriber):
         Returns:
             Tuple of (url, headers, data_or_files, request_type)
         """
-        # Base headers
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            **self.custom_headers
-        }
-        
+        # Copy the pre-resolved base headers (per-request code may add
+        # content-type entries)
+        headers = dict(self._base_headers)
+
         # Prepare data based on request format
         if self.request_format == "multipart/form-data":
-            # Form data with file upload
-            files = {
-                "audio": open(audio_file_path, "rb"),
-                "model": (None, self.api_model)
-            }
-            
+            # Copy the pre-resolved non-file form fields
+            fields = dict(self._fields_template)
+
             # Add language if specified
             language = kwargs.get('language')
             if language and language != 'auto':
-                files["language"] = (None, language)
-            
-            # Add custom parameters
-            for key, value in self.custom_params.items():
-                files[key] = (None, str(value))
-            
+                fields["language"] = language
+
+            audio_handle = open(audio_file_path, "rb")
+            content_type = mimetypes.guess_type(audio_file_path)[0] or 'application/octet-stream'
+
+            if REQUESTS_TOOLBELT_AVAILABLE:
+                # Streaming multipart body: peak memory stays at the read
+                # buffer instead of the whole audio file
+                fields["audio"] = (os.path.basename(audio_file_path), audio_handle, content_type)
+                encoder = MultipartEncoder(fields=fields)
+                headers["Content-Type"] = encoder.content_type
+                return self.transcription_endpoint, headers, encoder, 'stream'
+
+            # Fallback: in-memory multipart via requests' files= handling
+            files = {"audio": audio_handle}
+            files.update({key: (None, value) for key, value in fields.items()})
             return self.transcription_endpoint, headers, files, 'files'
         
         else:
@@ -107,7 +280,10 @@ class CustomAPITranscriber(ExternalAPITranscriber):
             TranscriptionResult object
         """
         try:
-            data = response.json()
+            if ORJSON_AVAILABLE:
+                data = orjson.loads(response.content)
+            else:
+                data = response.json()
         except ValueError:
             # If response is not JSON, treat as plain text
             text = response.text.strip()
@@ -115,68 +291,40 @@ class CustomAPITranscriber(ExternalAPITranscriber):
                 text=text,
                 confidence=None,
                 language=None,
-                word_count=len(text.split()) if text else 0
+                word_count=_count_words(text) if text else 0
             )
-        
-        # Try common response formats
-        text = None
-        confidence = None
-        language = None
-        word_count = None
-        
-        # Format 1: Direct text field
-        if 'text' in data:
-            text = data['text']
-        elif 'transcript' in data:
-            text = data['transcript']
-        elif 'transcription' in data:
-            text = data['transcription']
-        
-        # Format 2: Nested in results
-        elif 'results' in data:
-            results = data['results']
-            if isinstance(results, list) and results:
-                result = results[0]
-                text = result.get('text') or result.get('transcript')
-            elif isinstance(results, dict):
-                text = results.get('text') or results.get('transcript')
-        
-        # Format 3: OpenAI-style response
-        elif 'choices' in data and data['choices']:
-            text = data['choices'][0].get('text', '')
-        
+
+        # Walk the extraction tables until a path yields a value
+        text = next(
+            (v for v in (_dig(data, p) for p in self._TEXT_PATHS) if v is not None),
+            None
+        )
+        confidence = next(
+            (v for v in (_dig(data, p) for p in self._CONFIDENCE_PATHS) if v is not None),
+            None
+        )
+        language = next(
+            (v for v in (_dig(data, p) for p in self._LANGUAGE_PATHS) if v is not None),
+            None
+        )
+
         # Clean up text
         if text:
             text = text.strip()
-        
-        # Extract confidence if available
-        confidence_fields = ['confidence', 'score', 'accuracy']
-        for field in confidence_fields:
-            if field in data:
-                confidence = data[field]
-                break
-        
-        # Extract language if available
-        language_fields = ['language', 'detected_language', 'language_code']
-        for field in language_fields:
-            if field in data:
-                language = data[field]
-                break
-        
+
         # Extract word count if available
-        if 'word_count' in data:
-            word_count = data['word_count']
-        elif 'words' in data:
+        word_count = data.get('word_count') if isinstance(data, dict) else None
+        if word_count is None and isinstance(data, dict) and 'words' in data:
             words = data['words']
             if isinstance(words, list):
                 word_count = len(words)
             elif isinstance(words, int):
                 word_count = words
-        
+
         # Calculate word count from text if not provided
         if not word_count and text:
-            word_count = len(text.split())
-        
+            word_count = _count_words(text)
+
         return TranscriptionResult(
             text=text or "",
             confidence=confidence,
@@ -214,17 +362,17 @@ class CustomAPITranscriber(ExternalAPITranscriber):
         """
         try:
             # Try a simple GET request to test connectivity
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                **self.custom_headers
-            }
-            
-            response = requests.get(
-                self.api_endpoint,
-                headers=headers,
-                timeout=10
-            )
-            
+            headers = self._base_headers
+
+            if self.http_client is not None:
+                response = self.http_client.get(self.api_endpoint, headers=headers, timeout=10)
+            else:
+                response = requests.get(
+                    self.api_endpoint,
+                    headers=headers,
+                    timeout=10
+                )
+
             if response.status_code in [200, 404, 405]:  # 404/405 might be expected for POST-only endpoints
                 return True, f"Connection successful (HTTP {response.status_code})"
             else:
@@ -281,6 +429,7 @@ class CustomAPITranscriber(ExternalAPITranscriber):
             headers: Dictionary of custom headers
         """
         self.custom_headers.update(headers)
+        self._rebuild_request_templates()
     
     def set_custom_params(self, params: Dict[str, Any]):
         """
@@ -290,6 +439,7 @@ class CustomAPITranscriber(ExternalAPITranscriber):
             params: Dictionary of custom parameters
         """
         self.custom_params.update(params)
+        self._rebuild_request_templates()
     
     def set_request_format(self, format_type: str):
         """
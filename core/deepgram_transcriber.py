@@ -5,12 +5,110 @@ Implements external transcription using Deepgram's Speech-to-Text API.
 """
 
 import logging
+import mmap
+import os
 import requests
+from types import MappingProxyType
 from typing import Dict, Any, List
+from urllib.parse import urlencode
 from .external_transcribers import ExternalAPITranscriber, TranscriptionResult
 
+# orjson is optional: Deepgram responses for long audio carry thousands of
+# per-word timestamp entries, where its C decoder is several times faster
+# than the stdlib json used by response.json()
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ijson is optional: multi-hour recordings return word-timestamp payloads
+# tens of MB large, which a streaming parser walks without materializing
+# the whole tree in memory
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Compiled once: validate_configuration runs per transcriber construction
+_VALID_MODELS = frozenset({'nova-2', 'nova', 'enhanced', 'base'})
+
+# Static provider metadata, hoisted so the admin/info endpoints that call
+# get_usage_info/get_model_info repeatedly do not rebuild the literals per
+# call; the proxies keep the shared dicts read-only
+_USAGE_INFO_EXTRA = MappingProxyType({
+    'pricing': 'Competitive rates (contact for pricing)',
+    'features': [
+        'Nova-2: 30% reduction in Word Error Rate',
+        'Real-time and batch transcription',
+        'Custom model training',
+        'Domain-specific models (medical, finance)',
+        'Smart formatting and punctuation',
+        'Sentiment analysis',
+        'Language detection',
+        'Speaker diarization',
+        'Custom vocabulary'
+    ],
+    'documentation': 'https://developers.deepgram.com/',
+    'rate_limits': 'Enterprise-grade rate limits',
+    'supported_languages': [
+        'English', 'Spanish', 'French', 'German', 'Italian',
+        'Portuguese', 'Dutch', 'Hindi', 'Japanese', 'Korean',
+        'Chinese (Mandarin)', 'Russian', 'Arabic', 'Turkish',
+        'Swedish', 'and more'
+    ],
+    'models': {
+        'nova-2': 'Latest model with 30% WER reduction',
+        'nova': 'High-accuracy general model',
+        'enhanced': 'Legacy enhanced model',
+        'base': 'Standard accuracy model'
+    },
+    'specialized_models': [
+        'Nova-2 Medical',
+        'Nova-2 Finance',
+        'Nova-2 Conversational AI',
+        'Custom domain models'
+    ]
+})
+
+_MODEL_INFO = MappingProxyType({
+    'nova-2': {
+        'name': 'Nova-2',
+        'description': 'Latest generation model with 30% WER reduction',
+        'accuracy': 'Highest',
+        'speed': 'Fast',
+        'languages': '30+',
+        'use_cases': ['General transcription', 'High-accuracy requirements']
+    },
+    'nova': {
+        'name': 'Nova',
+        'description': 'High-accuracy general-purpose model',
+        'accuracy': 'High',
+        'speed': 'Fast',
+        'languages': '30+',
+        'use_cases': ['General transcription', 'Production workloads']
+    },
+    'enhanced': {
+        'name': 'Enhanced',
+        'description': 'Legacy enhanced model',
+        'accuracy': 'Medium-High',
+        'speed': 'Medium',
+        'languages': '20+',
+        'use_cases': ['Legacy applications', 'Cost-sensitive workloads']
+    },
+    'base': {
+        'name': 'Base',
+        'description': 'Standard accuracy model',
+        'accuracy': 'Medium',
+        'speed': 'Fast',
+        'languages': '15+',
+        'use_cases': ['Basic transcription', 'High-volume processing']
+    }
+})
+
 
 class DeepgramTranscriber(ExternalAPITranscriber):
     """Deepgram Speech-to-Text API transcription implementation"""
@@ -29,6 +127,19 @@ class DeepgramTranscriber(ExternalAPITranscriber):
             'sentiment': True,
             'summarize': False
         }
+
+        # Resolved once: every request reuses these instead of rebuilding
+        # the header dict and re-lowering the feature booleans per chunk
+        self._static_headers = {
+            "Authorization": f"Token {self.api_key}",
+            "Content-Type": "audio/*"
+        }
+        self._static_params = {
+            'model': self.api_model,
+            'version': 'latest',
+            **{k: str(v).lower() if isinstance(v, bool) else str(v)
+               for k, v in self.features.items()}
+        }
     
     def _get_default_model(self) -> str:
         """Get default model for Deepgram"""
@@ -53,38 +164,38 @@ class DeepgramTranscriber(ExternalAPITranscriber):
         Returns:
             Tuple of (url, headers, files, request_type)
         """
-        headers = {
-            "Authorization": f"Token {self.api_key}",
-            "Content-Type": "audio/*"
-        }
-        
-        # Build query parameters
-        params = {
-            'model': self.api_model,
-            'version': 'latest'
-        }
-        
+        headers = self._static_headers
+
+        # Copy the pre-resolved query params; only language varies per call
+        params = dict(self._static_params)
+
         # Add language if specified
         language = kwargs.get('language')
         if language and language != 'auto':
             params['language'] = language
         else:
             params['detect_language'] = 'true'
+
+        # Encode the query string once with urlencode (which also escapes
+        # values) instead of hand-joining f-strings
+        url = f"{self.transcription_endpoint}?{urlencode(params)}"
         
-        # Add features
-        params.update(self.features)
-        
-        # Build URL with query parameters
-        param_string = '&'.join([f"{k}={'true' if v is True else 'false' if v is False else str(v)}" 
-                                for k, v in params.items()])
-        url = f"{self.transcription_endpoint}?{param_string}"
-        
-        # Prepare file data
-        files = {
-            'audio': open(audio_file_path, 'rb')
-        }
-        
-        return url, headers, files, 'files'
+        # Deepgram accepts the audio bytes as a raw request body. Memory-map
+        # the file so the kernel pages it into the socket as the upload
+        # drains, keeping resident memory flat even for the 2GB limit;
+        # transcribe_file closes the map after the POST. The underlying fd
+        # can be closed as soon as the map exists.
+        try:
+            fd = os.open(audio_file_path, os.O_RDONLY)
+            try:
+                body = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            finally:
+                os.close(fd)
+        except (OSError, ValueError):
+            # Empty file or mmap-hostile filesystem: stream the handle
+            body = open(audio_file_path, 'rb')
+
+        return url, headers, body, 'stream'
     
     def _parse_response(self, response: requests.Response) -> TranscriptionResult:
         """
@@ -96,8 +207,18 @@ class DeepgramTranscriber(ExternalAPITranscriber):
         Returns:
             TranscriptionResult object
         """
-        data = response.json()
-        
+        # Stream-parse when possible: long recordings return word-level
+        # timestamp payloads large enough that building the full tree
+        # dominates peak memory
+        raw = getattr(response, 'raw', None)
+        if IJSON_AVAILABLE and raw is not None and not getattr(response, '_content_consumed', True):
+            return self._parse_response_streaming(raw)
+
+        if ORJSON_AVAILABLE:
+            data = orjson.loads(response.content)
+        else:
+            data = response.json()
+
         # Extract text from results
         text = ""
         confidence = None
@@ -112,11 +233,11 @@ class DeepgramTranscriber(ExternalAPITranscriber):
                 text = alternative.get('transcript', '').strip()
                 confidence = alternative.get('confidence', 0)
                 
-                # Count words from words array if available
-                if 'words' in alternative:
-                    word_count = len(alternative['words'])
-                else:
-                    word_count = len(text.split()) if text else 0
+                # Count words from the words array if available, splitting
+                # the transcript only as a fallback
+                word_count = len(alternative.get('words', ()))
+                if not word_count and text:
+                    word_count = len(text.split())
             
             # Extract detected language
             if 'detected_language' in channel:
@@ -128,7 +249,54 @@ class DeepgramTranscriber(ExternalAPITranscriber):
             language=language,
             word_count=word_count
         )
-    
+
+    def _parse_response_streaming(self, raw) -> TranscriptionResult:
+        """
+        Walk a streamed Deepgram response with ijson
+
+        Plucks the first alternative's transcript/confidence and counts its
+        words entry by entry, so the words array is never materialized as a
+        Python list.
+
+        Args:
+            raw: File-like response body (urllib3 raw stream)
+
+        Returns:
+            TranscriptionResult object
+        """
+        # Let urllib3 inflate gzip/deflate transparently for the parser
+        raw.decode_content = True
+
+        text = ""
+        confidence = None
+        language = None
+        word_count = 0
+        alt_count = 0
+
+        alt_prefix = 'results.channels.item.alternatives.item'
+        for prefix, event, value in ijson.parse(raw):
+            if prefix == alt_prefix and event == 'start_map':
+                alt_count += 1
+            elif alt_count == 1:
+                if prefix == f'{alt_prefix}.transcript':
+                    text = (value or '').strip()
+                elif prefix == f'{alt_prefix}.confidence':
+                    confidence = float(value)
+                elif prefix == f'{alt_prefix}.words.item' and event == 'start_map':
+                    word_count += 1
+            if prefix == 'results.channels.item.detected_language' and language is None:
+                language = value
+
+        if not word_count and text:
+            word_count = len(text.split())
+
+        return TranscriptionResult(
+            text=text,
+            confidence=confidence,
+            language=language,
+            word_count=word_count
+        )
+
     def validate_configuration(self) -> tuple[bool, str]:
         """
         Validate Deepgram-specific configuration
@@ -142,9 +310,8 @@ class DeepgramTranscriber(ExternalAPITranscriber):
             return is_valid, error_msg
         
         # Validate model
-        valid_models = ['nova-2', 'nova', 'enhanced', 'base']
-        if self.api_model not in valid_models:
-            return False, f"Invalid Deepgram model: {self.api_model}. Valid models: {', '.join(valid_models)}"
+        if self.api_model not in _VALID_MODELS:
+            return False, f"Invalid Deepgram model: {self.api_model}. Valid models: {', '.join(sorted(_VALID_MODELS))}"
         
         return True, ""
     
@@ -156,40 +323,7 @@ class DeepgramTranscriber(ExternalAPITranscriber):
             Dictionary with usage information
         """
         info = super().get_usage_info()
-        info.update({
-            'pricing': 'Competitive rates (contact for pricing)',
-            'features': [
-                'Nova-2: 30% reduction in Word Error Rate',
-                'Real-time and batch transcription',
-                'Custom model training',
-                'Domain-specific models (medical, finance)',
-                'Smart formatting and punctuation',
-                'Sentiment analysis',
-                'Language detection',
-                'Speaker diarization',
-                'Custom vocabulary'
-            ],
-            'documentation': 'https://developers.deepgram.com/',
-            'rate_limits': 'Enterprise-grade rate limits',
-            'supported_languages': [
-                'English', 'Spanish', 'French', 'German', 'Italian',
-                'Portuguese', 'Dutch', 'Hindi', 'Japanese', 'Korean',
-                'Chinese (Mandarin)', 'Russian', 'Arabic', 'Turkish',
-                'Swedish', 'and more'
-            ],
-            'models': {
-                'nova-2': 'Latest model with 30% WER reduction',
-                'nova': 'High-accuracy general model',
-                'enhanced': 'Legacy enhanced model',
-                'base': 'Standard accuracy model'
-            },
-            'specialized_models': [
-                'Nova-2 Medical',
-                'Nova-2 Finance',
-                'Nova-2 Conversational AI',
-                'Custom domain models'
-            ]
-        })
+        info.update(_USAGE_INFO_EXTRA)
         return info
     
     def estimate_cost(self, duration_minutes: float) -> Dict[str, Any]:
@@ -234,40 +368,4 @@ class DeepgramTranscriber(ExternalAPITranscriber):
             Model information dictionary
         """
         model = model_name or self.api_model
-        
-        model_info = {
-            'nova-2': {
-                'name': 'Nova-2',
-                'description': 'Latest generation model with 30% WER reduction',
-                'accuracy': 'Highest',
-                'speed': 'Fast',
-                'languages': '30+',
-                'use_cases': ['General transcription', 'High-accuracy requirements']
-            },
-            'nova': {
-                'name': 'Nova',
-                'description': 'High-accuracy general-purpose model',
-                'accuracy': 'High',
-                'speed': 'Fast',
-                'languages': '30+',
-                'use_cases': ['General transcription', 'Production workloads']
-            },
-            'enhanced': {
-                'name': 'Enhanced',
-                'description': 'Legacy enhanced model',
-                'accuracy': 'Medium-High',
-                'speed': 'Medium',
-                'languages': '20+',
-                'use_cases': ['Legacy applications', 'Cost-sensitive workloads']
-            },
-            'base': {
-                'name': 'Base',
-                'description': 'Standard accuracy model',
-                'accuracy': 'Medium',
-                'speed': 'Fast',
-                'languages': '15+',
-                'use_cases': ['Basic transcription', 'High-volume processing']
-            }
-        }
-        
-        return model_info.get(model, {'name': model, 'description': 'Unknown model'})
\ No newline at end of file
+        return _MODEL_INFO.get(model, {'name': model, 'description': 'Unknown model'})
\ No newline at end of file
@@ -5,17 +5,125 @@ This module provides a unified interface for various external transcription APIs
 including OpenAI Whisper API, AssemblyAI, Deepgram, and custom endpoints.
 """
 
+import functools
+import importlib
 import logging
+import os
+import random
 import requests
 import time
 import base64
 from abc import ABC, abstractmethod
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
 from typing import Dict, Any, Optional, List
 from django.conf import settings
 from .models import Meeting, AudioChunk
 
 logger = logging.getLogger(__name__)
 
+# One keep-alive session shared by every provider in this process: without
+# it each chunk pays a fresh TCP+TLS handshake to the same API host.
+# Retries stay at 0 here because transcribe_file runs its own retry loop.
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0))
+_session.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0))
+
+
+def _close_payload_files(payload):
+    """
+    Close any open file handles referenced by a request payload
+
+    Handles plain files= dicts, streaming encoders exposing a .fields
+    mapping, and bare file objects streamed as raw request bodies; dict
+    values may be raw file objects or (name, fileobj, content_type)
+    tuples.
+    """
+    fields = getattr(payload, 'fields', payload)
+    if not isinstance(fields, dict):
+        if hasattr(fields, 'close'):
+            try:
+                fields.close()
+            except Exception:
+                pass
+        return
+
+    for value in fields.values():
+        fileobj = value[1] if isinstance(value, tuple) and len(value) > 1 else value
+        if hasattr(fileobj, 'close'):
+            try:
+                fileobj.close()
+            except Exception:
+                pass
+
+
+# Client errors where a retry would only repeat the same rejection (and,
+# for 413, re-upload the entire file first)
+_NO_RETRY_STATUSES = frozenset({400, 401, 403, 404, 413, 415, 422})
+
+
+def _error_snippet(response) -> str:
+    """
+    Read at most 4KB of an error body for logging
+
+    A failed upload can come back with an arbitrarily large body; with a
+    streamed response this reads only the snippet that gets logged instead
+    of downloading the whole payload.
+    """
+    try:
+        iter_content = getattr(response, 'iter_content', None)
+        if iter_content is not None:
+            snippet = next(iter_content(chunk_size=4096), b'')
+            response.close()
+        else:
+            snippet = response.content[:4096]
+        if isinstance(snippet, bytes):
+            return snippet.decode('utf-8', 'replace')
+        return snippet
+    except Exception:
+        return '<unreadable body>'
+
+
+def _retry_wait(attempt: int, retry_after: str = None) -> float:
+    """
+    Compute the delay before a retry attempt
+
+    Honors a Retry-After header (seconds or HTTP-date) when the server sent
+    one; otherwise uses exponential backoff with jitter so concurrent
+    workers hitting the same throttle do not retry in lockstep.
+    """
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    return (2 ** attempt) * 0.5 + random.uniform(0, 1)
+
+
+@functools.lru_cache(maxsize=1024)
+def _file_ext(file_path: str) -> str:
+    """Lowercased extension for a path, cached across repeat validations"""
+    return os.path.splitext(file_path)[1].lower()
+
+
+@functools.lru_cache(maxsize=128)
+def _decrypt_api_key(encrypted_key: str) -> Optional[str]:
+    """
+    Decrypt an API key from database storage
+
+    Cached on the ciphertext so constructing a transcriber per chunk does
+    not re-decode the same credentials; changed credentials form a new
+    cache key, so no explicit invalidation is needed.
+    """
+    try:
+        return base64.b64decode(encrypted_key.encode()).decode()
+    except Exception as e:
+        logger.error(f"Failed to decrypt API key: {e}")
+        return None
+
 
 class TranscriptionResult:
     """Container for transcription results from external APIs"""
@@ -46,7 +154,7 @@ class ExternalAPITranscriber(ABC):
             meeting: Meeting instance with API configuration
         """
         self.meeting = meeting
-        self.api_key = self._decrypt_api_key(meeting.api_credentials) if meeting.api_credentials else None
+        self.api_key = _decrypt_api_key(meeting.api_credentials) if meeting.api_credentials else None
         self.api_endpoint = meeting.api_endpoint
         self.api_model = meeting.api_model or self._get_default_model()
         self.timeout = getattr(settings, 'EXTERNAL_API_TIMEOUT', 300)  # 5 minutes default
@@ -54,15 +162,12 @@ class ExternalAPITranscriber(ABC):
         
         # Provider-specific configuration
         self.configure_provider()
-    
-    def _decrypt_api_key(self, encrypted_key: str) -> str:
-        """Decrypt API key from database storage"""
-        try:
-            return base64.b64decode(encrypted_key.encode()).decode()
-        except Exception as e:
-            logger.error(f"Failed to decrypt API key: {e}")
-            return None
-    
+
+        # Resolve the per-provider limits once; per-call validation is
+        # then a single stat plus a set lookup
+        self._max_file_size = self._get_max_file_size()
+        self._allowed_formats = frozenset(fmt.lower() for fmt in self._get_allowed_formats())
+
     @abstractmethod
     def configure_provider(self):
         """Configure provider-specific settings"""
@@ -125,23 +230,20 @@ class ExternalAPITranscriber(ABC):
         Returns:
             Tuple of (is_valid, error_message)
         """
-        import os
-        
-        if not os.path.exists(file_path):
+        # One stat covers both the existence check and the size read
+        try:
+            file_size = os.stat(file_path).st_size
+        except FileNotFoundError:
             return False, f"Audio file not found: {file_path}"
-        
-        file_size = os.path.getsize(file_path)
-        max_size = self._get_max_file_size()
-        
-        if file_size > max_size:
-            return False, f"File too large: {file_size / (1024*1024):.1f}MB exceeds {max_size / (1024*1024):.1f}MB limit"
-        
+
+        if file_size > self._max_file_size:
+            return False, f"File too large: {file_size / (1024*1024):.1f}MB exceeds {self._max_file_size / (1024*1024):.1f}MB limit"
+
         # Check format
-        allowed_formats = self._get_allowed_formats()
-        file_ext = os.path.splitext(file_path)[1].lower()
-        if file_ext not in allowed_formats:
-            return False, f"Unsupported format: {file_ext}. Allowed: {', '.join(allowed_formats)}"
-        
+        file_ext = _file_ext(file_path)
+        if file_ext not in self._allowed_formats:
+            return False, f"Unsupported format: {file_ext}. Allowed: {', '.join(sorted(self._allowed_formats))}"
+
         return True, ""
     
     def _get_max_file_size(self) -> int:
@@ -181,8 +283,9 @@ class ExternalAPITranscriber(ABC):
             raise Exception(f"File validation error: {error_msg}")
         
         last_error = None
-        
+
         for attempt in range(self.max_retries + 1):
+            retry_after = None
             try:
                 logger.info(f"Transcription attempt {attempt + 1}/{self.max_retries + 1} for {audio_file_path}")
                 
@@ -191,11 +294,37 @@ class ExternalAPITranscriber(ABC):
                     audio_file_path, language=language, **kwargs
                 )
                 
-                # Make API request
-                if request_type == 'files':
-                    response = requests.post(url, headers=headers, files=data_or_files, timeout=self.timeout)
-                else:
-                    response = requests.post(url, headers=headers, json=data_or_files, timeout=self.timeout)
+                # Make API request, always releasing any file handle the
+                # payload holds open. Providers that configured a pooled
+                # http_client reuse its keep-alive connections instead of
+                # paying TCP+TLS setup per request.
+                client = getattr(self, 'http_client', None)
+                try:
+                    if client is not None:
+                        if request_type == 'files':
+                            response = client.post(url, headers=headers, files=data_or_files, timeout=self.timeout)
+                        elif request_type == 'stream':
+                            # httpx takes streaming bodies as a byte iterator
+                            response = client.post(
+                                url, headers=headers,
+                                content=iter(lambda: data_or_files.read(8192), b''),
+                                timeout=self.timeout
+                            )
+                        else:
+                            response = client.post(url, headers=headers, json=data_or_files, timeout=self.timeout)
+                    elif request_type == 'files':
+                        response = _session.post(url, headers=headers, files=data_or_files,
+                                                 timeout=self.timeout, stream=True)
+                    elif request_type == 'stream':
+                        # Streaming body (e.g. MultipartEncoder) read
+                        # incrementally by requests
+                        response = _session.post(url, headers=headers, data=data_or_files,
+                                                 timeout=self.timeout, stream=True)
+                    else:
+                        response = _session.post(url, headers=headers, json=data_or_files,
+                                                 timeout=self.timeout, stream=True)
+                finally:
+                    _close_payload_files(data_or_files)
                 
                 # Check response
                 if response.status_code == 200:
@@ -207,14 +336,21 @@ class ExternalAPITranscriber(ABC):
                     
                     return result
                 else:
-                    error_msg = f"API request failed: {response.status_code} - {response.text}"
+                    error_msg = f"API request failed: {response.status_code} - {_error_snippet(response)}"
                     logger.warning(error_msg)
                     last_error = Exception(error_msg)
                     
-                    # Don't retry on certain errors
-                    if response.status_code in [400, 401, 403]:
+                    # Don't retry on client errors the next attempt cannot
+                    # fix — notably 413/415, where retrying re-uploads the
+                    # whole file just to be rejected again
+                    if response.status_code in _NO_RETRY_STATUSES:
                         break
-                    
+
+                    # A throttled or overloaded server tells us when to
+                    # come back
+                    if response.status_code in [429, 503]:
+                        retry_after = response.headers.get('Retry-After')
+
             except requests.exceptions.Timeout:
                 error_msg = f"Request timeout after {self.timeout}s"
                 logger.warning(error_msg)
@@ -230,10 +366,11 @@ class ExternalAPITranscriber(ABC):
                 logger.warning(error_msg)
                 last_error = Exception(error_msg)
             
-            # Wait before retry (exponential backoff)
+            # Wait before retry (jittered exponential backoff, or the
+            # server-provided Retry-After)
             if attempt < self.max_retries:
-                wait_time = (2 ** attempt) * 1.0  # 1s, 2s, 4s, etc.
-                logger.info(f"Waiting {wait_time}s before retry...")
+                wait_time = _retry_wait(attempt, retry_after)
+                logger.info(f"Waiting {wait_time:.1f}s before retry...")
                 time.sleep(wait_time)
         
         # All retries failed
@@ -246,21 +383,25 @@ class ExternalAPITranscriber(ABC):
         else:
             raise Exception(error_msg)
     
-    def transcribe_chunk(self, chunk: AudioChunk, language: str = None) -> bool:
+    def transcribe_chunk(self, chunk: AudioChunk, language: str = None,
+                         defer_save: bool = False) -> bool:
         """
         Transcribe an audio chunk using external API
-        
+
         Args:
             chunk: AudioChunk instance to transcribe
             language: Language code (optional)
-            
+            defer_save: Mutate the chunk in memory only, leaving the
+                caller to flush status writes (e.g. via bulk_update)
+
         Returns:
             True if successful, False otherwise
         """
         try:
             chunk.status = 'processing'
-            chunk.save()
-            
+            if not defer_save:
+                chunk.save()
+
             logger.info(f"Starting external API transcription for chunk {chunk.chunk_index} "
                        f"of meeting {chunk.meeting.id} using {self.meeting.transcription_provider}")
             
@@ -275,26 +416,88 @@ class ExternalAPITranscriber(ABC):
             # Store additional metadata if available
             if hasattr(chunk, 'confidence_score') and result.confidence:
                 chunk.confidence_score = result.confidence
-            
-            chunk.save()
-            
+
+            if not defer_save:
+                chunk.save()
+
             logger.info(f"External API transcription completed for chunk {chunk.chunk_index}: "
                        f"{len(result.text)} characters")
-            
+
             return True
-            
+
         except Exception as e:
             chunk.status = 'failed'
             chunk.error_message = f"External API transcription failed: {str(e)}"
-            chunk.save()
-            
+            if not defer_save:
+                chunk.save()
+
             logger.error(f"External API transcription failed for chunk {chunk.chunk_index}: {e}")
             return False
     
+    def transcribe_chunks(self, chunks: List[AudioChunk], language: str = None,
+                          max_workers: int = None) -> int:
+        """
+        Transcribe multiple chunks concurrently, persisting each result
+
+        Each transcribe_chunk call blocks on an HTTP round-trip, so fanning
+        out over a thread pool turns total time from sum-of-chunks into
+        roughly max-of-chunks.
+
+        Args:
+            chunks: AudioChunk instances to transcribe
+            language: Language code (optional)
+            max_workers: Concurrent request limit (default from
+                settings.EXTERNAL_API_MAX_CONCURRENCY, 8)
+
+        Returns:
+            Number of chunks transcribed successfully
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        from django.db import close_old_connections, transaction
+
+        chunks = list(chunks)
+        if not chunks:
+            return 0
+
+        if max_workers is None:
+            max_workers = getattr(settings, 'EXTERNAL_API_MAX_CONCURRENCY', 8)
+        max_workers = min(max_workers, len(chunks))
+
+        # Flip every chunk to processing with one UPDATE instead of a
+        # write per worker
+        AudioChunk.objects.filter(pk__in=[c.pk for c in chunks]).update(status='processing')
+
+        def worker(chunk):
+            # Each pool thread owns its own DB connection; drop stale ones
+            # before any per-thread queries
+            close_old_connections()
+            return self.transcribe_chunk(chunk, language, defer_save=True)
+
+        success_count = 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(worker, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    if future.result():
+                        success_count += 1
+                except Exception as e:
+                    logger.error(f"Chunk {chunk.chunk_index} API transcription raised: {e}")
+
+        # Workers deferred their saves; flush all final chunk states in
+        # one statement
+        with transaction.atomic():
+            AudioChunk.bulk_update_progress(
+                chunks,
+                fields=('status', 'transcript_text', 'progress', 'error_message')
+            )
+
+        return success_count
+
     def get_usage_info(self) -> Dict[str, Any]:
         """
         Get usage information and cost estimates
-        
+
         Returns:
             Dictionary with usage information
         """
@@ -308,6 +511,55 @@ class ExternalAPITranscriber(ABC):
         }
 
 
+def transcribe_chunks_via_api(meeting: Meeting, chunks: List[AudioChunk],
+                              max_concurrent: int = None,
+                              language: str = None) -> Dict[int, Optional[TranscriptionResult]]:
+    """
+    Transcribe multiple chunk files concurrently against a remote API
+
+    API transcription is network-bound, so in-flight requests are cheap to
+    overlap: a bounded thread pool keeps several HTTP round-trips open at
+    once while each worker blocks on its socket.
+
+    Args:
+        meeting: Meeting instance with API configuration
+        chunks: AudioChunk instances to transcribe
+        max_concurrent: Concurrent request limit (default from
+            settings.API_TRANSCRIPTION_CONCURRENCY, 5)
+        language: Language code (optional)
+
+    Returns:
+        Mapping of chunk_index -> TranscriptionResult (None where a chunk
+        failed after retries)
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    if not chunks:
+        return {}
+
+    if max_concurrent is None:
+        max_concurrent = getattr(settings, 'API_TRANSCRIPTION_CONCURRENCY', 5)
+
+    transcriber = create_external_transcriber(meeting)
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=min(max_concurrent, len(chunks))) as executor:
+        futures = {
+            executor.submit(transcriber.transcribe_file, chunk.file_path, language): chunk
+            for chunk in chunks
+        }
+
+        for future in as_completed(futures):
+            chunk = futures[future]
+            try:
+                results[chunk.chunk_index] = future.result()
+            except Exception as e:
+                logger.error(f"API transcription failed for chunk {chunk.chunk_index}: {e}")
+                results[chunk.chunk_index] = None
+
+    return results
+
+
 def create_external_transcriber(meeting: Meeting) -> ExternalAPITranscriber:
     """
     Factory function to create appropriate external transcriber
@@ -322,18 +574,30 @@ def create_external_transcriber(meeting: Meeting) -> ExternalAPITranscriber:
         ValueError: If provider is not supported
     """
     provider = meeting.transcription_provider
-    
-    if provider == 'openai':
-        from .openai_transcriber import OpenAITranscriber
-        return OpenAITranscriber(meeting)
-    elif provider == 'assemblyai':
-        from .assemblyai_transcriber import AssemblyAITranscriber
-        return AssemblyAITranscriber(meeting)
-    elif provider == 'deepgram':
-        from .deepgram_transcriber import DeepgramTranscriber
-        return DeepgramTranscriber(meeting)
-    elif provider == 'custom':
-        from .custom_transcriber import CustomAPITranscriber
-        return CustomAPITranscriber(meeting)
-    else:
-        raise ValueError(f"Unsupported transcription provider: {provider}")
\ No newline at end of file
+
+    try:
+        return _get_provider_cls(provider)(meeting)
+    except KeyError:
+        raise ValueError(f"Unsupported transcription provider: {provider}")
+
+
+# Lazily imported provider classes, cached after first use so repeat
+# factory calls skip both the if/elif dispatch and the import statement
+_PROVIDER_MODULES = {
+    'openai': ('openai_transcriber', 'OpenAITranscriber'),
+    'assemblyai': ('assemblyai_transcriber', 'AssemblyAITranscriber'),
+    'deepgram': ('deepgram_transcriber', 'DeepgramTranscriber'),
+    'custom': ('custom_transcriber', 'CustomAPITranscriber'),
+}
+_PROVIDERS = {}
+
+
+def _get_provider_cls(provider: str):
+    """Resolve a provider name to its transcriber class, importing lazily"""
+    cls = _PROVIDERS.get(provider)
+    if cls is None:
+        module_name, class_name = _PROVIDER_MODULES[provider]
+        module = importlib.import_module(f'.{module_name}', package=__package__)
+        cls = getattr(module, class_name)
+        _PROVIDERS[provider] = cls
+    return cls
\ No newline at end of file
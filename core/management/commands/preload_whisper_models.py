@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from django.core.management.base import BaseCommand
 from django.conf import settings
 from core.utils import preload_whisper_models, get_or_create_whisper_model, validate_model_functionality
@@ -48,22 +49,32 @@ class Command(BaseCommand):
 
         self.stdout.write(f'Preloading Whisper models: {", ".join(models_to_load)}')
 
-        for model_name in models_to_load:
-            try:
-                self.stdout.write(f'Loading {model_name}...', ending='')
-                get_or_create_whisper_model(model_name)
-                self.stdout.write(self.style.SUCCESS(' ✓'))
-                
-                # Validate if requested
-                if options['validate']:
-                    self.stdout.write(f'  Validating {model_name}...', ending='')
-                    if validate_model_functionality(model_name):
-                        self.stdout.write(self.style.SUCCESS(' ✓'))
-                    else:
-                        self.stdout.write(self.style.WARNING(' ⚠ - validation issues'))
-                        
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f' ✗ - {str(e)}'))
-                logger.error(f'Failed to load model {model_name}: {str(e)}')
+        # Loads are independent and IO-bound (disk read + decode), so run
+        # them concurrently; validation stays in the main thread as each
+        # model resolves
+        max_workers = min(4, len(models_to_load))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(get_or_create_whisper_model, model_name): model_name
+                for model_name in models_to_load
+            }
+
+            for future in as_completed(futures):
+                model_name = futures[future]
+                try:
+                    future.result()
+                    self.stdout.write(self.style.SUCCESS(f'Loaded {model_name} ✓'))
+
+                    # Validate if requested
+                    if options['validate']:
+                        self.stdout.write(f'  Validating {model_name}...', ending='')
+                        if validate_model_functionality(model_name):
+                            self.stdout.write(self.style.SUCCESS(' ✓'))
+                        else:
+                            self.stdout.write(self.style.WARNING(' ⚠ - validation issues'))
+
+                except Exception as e:
+                    self.stdout.write(self.style.ERROR(f'Loading {model_name} ✗ - {str(e)}'))
+                    logger.error(f'Failed to load model {model_name}: {str(e)}')
 
         self.stdout.write(self.style.SUCCESS('Model preloading completed'))
\ No newline at end of file
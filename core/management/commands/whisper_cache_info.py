@@ -1,10 +1,16 @@
 from django.core.management.base import BaseCommand
 from django.conf import settings
 import os
-import subprocess
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# HuggingFace cache directory prefix for faster-whisper model repos
+_MODEL_DIR_PREFIX = 'models--Systran--faster-whisper-'
+
+# Files a complete snapshot must contain; model.bin leads since it is the
+# one an interrupted download leaves missing
+_REQUIRED_MODEL_FILES = frozenset({'model.bin', 'config.json', 'tokenizer.json', 'vocabulary.txt'})
+
 
 class Command(BaseCommand):
     help = 'Display information about Whisper model cache'
@@ -22,115 +28,191 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
+        # Per-run memo for _get_directory_size, keyed on (path, mtime_ns)
+        # so a subtree is only walked once per invocation
+        self._size_cache = {}
+
         cache_dir = Path.home() / '.cache' / 'huggingface' / 'hub'
         
         if not cache_dir.exists():
             self.stdout.write(self.style.WARNING('HuggingFace cache directory not found'))
             return
 
-        self.stdout.write(self.style.SUCCESS('=== Whisper Model Cache Information ===\n'))
+        # Buffer report lines and emit them with a single write at the end;
+        # per-line stdout writes each flush the underlying stream
+        lines = [self.style.SUCCESS('=== Whisper Model Cache Information ===\n')]
 
-        # Find all faster-whisper models
+        # Find all faster-whisper models with a single directory read; a
+        # startswith on the entry name replaces the glob's pattern matching
         whisper_models = []
-        for model_dir in cache_dir.glob('models--Systran--faster-whisper-*'):
-            if model_dir.is_dir():
-                whisper_models.append(model_dir)
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(_MODEL_DIR_PREFIX) and entry.is_dir(follow_symlinks=False):
+                    whisper_models.append(Path(entry.path))
 
         if not whisper_models:
             self.stdout.write(self.style.WARNING('No Whisper models found in cache'))
             return
 
-        # Show cache overview
-        total_size = self._get_directory_size(cache_dir)
-        self.stdout.write(f'📍 Cache Location: {cache_dir}')
-        self.stdout.write(f'💾 Total Cache Size: {self._format_size(total_size)}')
-        self.stdout.write(f'🔢 Whisper Models Found: {len(whisper_models)}\n')
+        # Size each model first so the cache-wide total below reuses the
+        # memoized subtree walks instead of traversing every file twice.
+        # The walks are stat-bound, so sizing the model dirs in parallel
+        # overlaps the disk waits.
+        with ThreadPoolExecutor(max_workers=min(8, len(whisper_models))) as executor:
+            model_sizes = dict(zip(
+                whisper_models,
+                executor.map(self._get_directory_size, whisper_models)
+            ))
+
+        # Show cache overview — sum the top-level entries so the whisper
+        # model subtrees hit the memo
+        total_size = 0
+        try:
+            with os.scandir(cache_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        total_size += self._get_directory_size(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total_size += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            total_size = self._get_directory_size(cache_dir)
+        lines.append(f'📍 Cache Location: {cache_dir}')
+        lines.append(f'💾 Total Cache Size: {self._format_size(total_size)}')
+        lines.append(f'🔢 Whisper Models Found: {len(whisper_models)}\n')
 
         # Show each model
         for model_dir in sorted(whisper_models):
-            model_name = model_dir.name.replace('models--Systran--faster-whisper-', '')
-            model_size = self._get_directory_size(model_dir)
+            model_name = model_dir.name[len(_MODEL_DIR_PREFIX):]
+            model_size = model_sizes[model_dir]
             
             # Check if model is complete
             snapshots_dir = model_dir / 'snapshots'
             is_complete = self._check_model_completeness(snapshots_dir)
             
             status = '✅' if is_complete else '❌'
-            self.stdout.write(f'{status} {model_name.ljust(12)} - {self._format_size(model_size)}')
-            
+            lines.append(f'{status} {model_name.ljust(12)} - {self._format_size(model_size)}')
+
             if options['detailed']:
-                self._show_detailed_info(model_dir, model_name)
+                self._show_detailed_info(lines, model_dir, model_name)
+
+        self.stdout.write('\n'.join(lines))
 
+        # Cleanup stays unbuffered: it prompts interactively per model
         if options['cleanup']:
             self._cleanup_cache(whisper_models)
 
+    def _iter_file_sizes(self, path):
+        """
+        Yield file sizes under path via recursive scandir
+
+        DirEntry reuses the metadata the directory read already returned,
+        so each file costs one stat instead of the exists+getsize pair
+        os.walk incurred — noticeable on caches with thousands of blobs.
+        Symlinks are skipped, which also avoids double-counting snapshot
+        links to the blob store.
+        """
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_symlink():
+                            continue
+                        if entry.is_file(follow_symlinks=False):
+                            yield entry.stat(follow_symlinks=False).st_size
+                        elif entry.is_dir(follow_symlinks=False):
+                            yield from self._iter_file_sizes(entry.path)
+                    except (PermissionError, FileNotFoundError):
+                        continue
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
+            return
+
     def _get_directory_size(self, path):
-        """Get the total size of a directory in bytes"""
+        """Get the total size of a directory in bytes, memoized per run"""
+        cache = getattr(self, '_size_cache', None)
+        try:
+            key = (str(path), os.stat(path).st_mtime_ns)
+        except OSError:
+            key = None
+        if cache is not None and key in cache:
+            return cache[key]
         try:
-            # Use Python to calculate directory size for better cross-platform compatibility
-            total_size = 0
-            for dirpath, dirnames, filenames in os.walk(path):
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    if os.path.exists(filepath):
-                        total_size += os.path.getsize(filepath)
-            return total_size
+            size = sum(self._iter_file_sizes(path))
         except (OSError, IOError):
-            return 0
+            size = 0
+        if cache is not None and key is not None:
+            cache[key] = size
+        return size
 
     def _format_size(self, size_bytes):
         """Format bytes to human readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f}{unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f}TB"
+        if size_bytes <= 0:
+            return "0.0B"
+        # Pick the unit straight from the bit length (each unit step is 10
+        # bits) instead of repeatedly dividing by 1024
+        units = ('B', 'KB', 'MB', 'GB', 'TB')
+        i = min((size_bytes.bit_length() - 1) // 10, 4)
+        return f"{size_bytes / (1 << (10 * i)):.1f}{units[i]}"
 
     def _check_model_completeness(self, snapshots_dir):
         """Check if model has all required files"""
-        if not snapshots_dir.exists():
+        # Find the latest snapshot; scandir doubles as the existence check
+        try:
+            with os.scandir(snapshots_dir) as entries:
+                snapshots = list(entries)
+        except (FileNotFoundError, NotADirectoryError, OSError):
             return False
-        
-        # Find the latest snapshot
-        snapshots = list(snapshots_dir.glob('*'))
+
         if not snapshots:
             return False
-        
+
         latest_snapshot = snapshots[0]  # Should only be one in most cases
-        required_files = ['config.json', 'model.bin', 'tokenizer.json', 'vocabulary.txt']
-        
-        for file_name in required_files:
-            file_path = latest_snapshot / file_name
-            if not file_path.exists():
-                return False
-        
-        return True
 
-    def _show_detailed_info(self, model_dir, model_name):
-        """Show detailed information about a specific model"""
+        # One directory read and a subset test answer all four membership
+        # checks instead of a stat per required file
+        try:
+            with os.scandir(latest_snapshot.path) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            return False
+
+        return _REQUIRED_MODEL_FILES <= present
+
+    def _show_detailed_info(self, lines, model_dir, model_name):
+        """Append detailed information about a specific model to the report"""
         snapshots_dir = model_dir / 'snapshots'
-        
-        if snapshots_dir.exists():
-            snapshots = list(snapshots_dir.glob('*'))
-            if snapshots:
-                snapshot_dir = snapshots[0]
-                self.stdout.write(f'  📁 Snapshot: {snapshot_dir.name}')
-                
-                # Show individual file sizes
-                files = ['config.json', 'model.bin', 'tokenizer.json', 'vocabulary.txt']
-                for file_name in files:
-                    file_path = snapshot_dir / file_name
-                    if file_path.exists():
-                        if file_path.is_symlink():
-                            # Follow symlink to get actual size
-                            actual_path = file_path.resolve()
-                            if actual_path.exists():
-                                size = actual_path.stat().st_size
-                                self.stdout.write(f'    {file_name}: {self._format_size(size)}')
-                        else:
-                            size = file_path.stat().st_size
-                            self.stdout.write(f'    {file_name}: {self._format_size(size)}')
-        self.stdout.write('')
+
+        try:
+            with os.scandir(snapshots_dir) as entries:
+                snapshots = list(entries)
+        except (FileNotFoundError, NotADirectoryError, OSError):
+            snapshots = []
+
+        if snapshots:
+            snapshot = snapshots[0]
+            lines.append(f'  📁 Snapshot: {snapshot.name}')
+
+            # Index the snapshot once; the DirEntry lookups replace the
+            # exists/is_symlink/resolve/stat sequence per file
+            try:
+                with os.scandir(snapshot.path) as entries:
+                    snapshot_files = {entry.name: entry for entry in entries}
+            except OSError:
+                snapshot_files = {}
+
+            # Show individual file sizes
+            files = ['config.json', 'model.bin', 'tokenizer.json', 'vocabulary.txt']
+            for file_name in files:
+                entry = snapshot_files.get(file_name)
+                if entry is None:
+                    continue
+                try:
+                    # stat() follows symlinks, resolving snapshot links to
+                    # the blob store in a single call
+                    size = entry.stat().st_size
+                except OSError:
+                    continue
+                lines.append(f'    {file_name}: {self._format_size(size)}')
+        lines.append('')
 
     def _cleanup_cache(self, whisper_models):
         """Clean up corrupted or incomplete models"""
@@ -138,7 +220,7 @@ class Command(BaseCommand):
         
         cleaned = False
         for model_dir in whisper_models:
-            model_name = model_dir.name.replace('models--Systran--faster-whisper-', '')
+            model_name = model_dir.name[len(_MODEL_DIR_PREFIX):]
             snapshots_dir = model_dir / 'snapshots'
             
             if not self._check_model_completeness(snapshots_dir):
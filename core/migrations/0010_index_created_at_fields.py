@@ -0,0 +1,50 @@
+# Index created_at on all models so admin changelist ordering and
+# click-sorting stay on indexed columns
+
+from django.db import migrations, models
+
+
+def restore_audiochunk_table(apps, schema_editor):
+    """
+    Recreate the AudioChunk table if it is missing.
+
+    Migration 0006 dropped core_audiochunk with raw SQL without touching
+    migration state, so databases migrated past it have no table even though
+    the model (and later AlterField operations) expect one.
+    """
+    AudioChunk = apps.get_model('core', 'AudioChunk')
+    table_name = AudioChunk._meta.db_table
+    existing_tables = schema_editor.connection.introspection.table_names()
+    if table_name not in existing_tables:
+        schema_editor.create_model(AudioChunk)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_add_processing_started_at_field'),
+    ]
+
+    operations = [
+        migrations.RunPython(restore_audiochunk_table, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='audiochunk',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='insight',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='meeting',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name='transcript',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Composite index so AudioChunk changelist ordering and per-meeting status
+# scans are served by an index instead of a filesort
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_index_created_at_fields'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='audiochunk',
+            index=models.Index(fields=['meeting', 'chunk_index', 'status'],
+                               name='audiochunk_mtg_idx_status'),
+        ),
+    ]
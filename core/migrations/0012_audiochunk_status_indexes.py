@@ -0,0 +1,21 @@
+# Generated by Django 4.2.23 on 2026-08-29 20:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_audiochunk_composite_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='audiochunk',
+            index=models.Index(fields=['meeting', 'status'], name='audiochunk_mtg_status'),
+        ),
+        migrations.AddIndex(
+            model_name='audiochunk',
+            index=models.Index(fields=['status', 'updated_at'], name='audiochunk_status_updated'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.utils import timezone
 import uuid
 import os
 
@@ -8,17 +9,30 @@ def upload_audio_path(instance, filename):
     return f'audio/{instance.id}/{filename}'
 
 
+# Shared choice lists, declared once at module level; the model classes
+# alias them so each class body does not rebuild identical lists during
+# app loading
+WHISPER_MODEL_CHOICES = [
+    ('tiny', 'Tiny'),
+    ('base', 'Base'),
+    ('small', 'Small'),
+    ('medium', 'Medium'),
+    ('large', 'Large'),
+    ('large-v2', 'Large V2'),
+    ('large-v3', 'Large V3'),
+]
+
+STATUS_CHOICES = [
+    ('pending', 'Pending'),
+    ('processing', 'Processing'),
+    ('completed', 'Completed'),
+    ('failed', 'Failed'),
+]
+
+
 class Meeting(models.Model):
-    WHISPER_MODEL_CHOICES = [
-        ('tiny', 'Tiny'),
-        ('base', 'Base'),
-        ('small', 'Small'),
-        ('medium', 'Medium'),
-        ('large', 'Large'),
-        ('large-v2', 'Large V2'),
-        ('large-v3', 'Large V3'),
-    ]
-    
+    WHISPER_MODEL_CHOICES = WHISPER_MODEL_CHOICES
+
     TRANSCRIPTION_PROVIDER_CHOICES = [
         ('local', 'Local Whisper Models'),
         ('openai', 'OpenAI Whisper API'),
@@ -43,7 +57,7 @@ class Meeting(models.Model):
     api_model = models.CharField(max_length=50, blank=True, help_text="API-specific model name")
     api_credentials = models.TextField(blank=True, help_text="Encrypted API credentials")
     
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
     created_by = models.ForeignKey(User, on_delete=models.CASCADE, blank=True, null=True)
     
@@ -55,23 +69,10 @@ class Meeting(models.Model):
 
 
 class Transcript(models.Model):
-    WHISPER_MODEL_CHOICES = [
-        ('tiny', 'Tiny'),
-        ('base', 'Base'),
-        ('small', 'Small'),
-        ('medium', 'Medium'),
-        ('large', 'Large'),
-        ('large-v2', 'Large V2'),
-        ('large-v3', 'Large V3'),
-    ]
-    
-    STATUS_CHOICES = [
-        ('pending', 'Pending'),
-        ('processing', 'Processing'),
-        ('completed', 'Completed'),
-        ('failed', 'Failed'),
-    ]
-    
+    WHISPER_MODEL_CHOICES = WHISPER_MODEL_CHOICES
+    STATUS_CHOICES = STATUS_CHOICES
+
+
     meeting = models.OneToOneField(Meeting, on_delete=models.CASCADE, related_name='transcript')
     text = models.TextField(blank=True)
     whisper_model = models.CharField(max_length=20, choices=WHISPER_MODEL_CHOICES, default='base')
@@ -79,7 +80,7 @@ class Transcript(models.Model):
     progress = models.IntegerField(default=0)  # 0-100
     error_message = models.TextField(blank=True)
     processing_time = models.DurationField(blank=True, null=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     def __str__(self):
@@ -91,13 +92,9 @@ class AudioChunk(models.Model):
     Model for managing chunks of large audio files (>100MB)
     Enables processing large files by splitting them into manageable segments
     """
-    STATUS_CHOICES = [
-        ('pending', 'Pending'),
-        ('processing', 'Processing'),
-        ('completed', 'Completed'),
-        ('failed', 'Failed'),
-    ]
-    
+    STATUS_CHOICES = STATUS_CHOICES
+
+
     meeting = models.ForeignKey(Meeting, on_delete=models.CASCADE, related_name='chunks')
     chunk_index = models.IntegerField()  # Order of this chunk in the sequence
     start_time = models.FloatField()     # Start time in seconds
@@ -110,25 +107,50 @@ class AudioChunk(models.Model):
     progress = models.IntegerField(default=0)  # 0-100
     error_message = models.TextField(blank=True)
     processing_time = models.DurationField(blank=True, null=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
         ordering = ['meeting', 'chunk_index']
         unique_together = ['meeting', 'chunk_index']
+        indexes = [
+            # Covers admin changelist ordering and the transcriber's
+            # per-meeting status scans without a filesort
+            models.Index(fields=['meeting', 'chunk_index', 'status'],
+                         name='audiochunk_mtg_idx_status'),
+            # Progress pollers filter (meeting, status) directly
+            models.Index(fields=['meeting', 'status'],
+                         name='audiochunk_mtg_status'),
+            # Watchdog stuck-chunk scans filter status and updated_at
+            models.Index(fields=['status', 'updated_at'],
+                         name='audiochunk_status_updated'),
+        ]
     
     def __str__(self):
         return f"Chunk {self.chunk_index} for {self.meeting}"
 
+    @classmethod
+    def bulk_update_progress(cls, chunks,
+                             fields=('status', 'progress', 'transcript_text', 'error_message')):
+        """
+        Persist progress fields for many chunks in one UPDATE round-trip
+
+        bulk_update bypasses auto_now, so updated_at is refreshed here
+        manually — the stuck-chunk watchdog relies on it being current.
+        """
+        chunks = list(chunks)
+        if not chunks:
+            return
+        now = timezone.now()
+        for chunk in chunks:
+            chunk.updated_at = now
+        cls.objects.bulk_update(chunks, [*fields, 'updated_at'], batch_size=100)
+
 
 class Insight(models.Model):
-    STATUS_CHOICES = [
-        ('pending', 'Pending'),
-        ('processing', 'Processing'),
-        ('completed', 'Completed'),
-        ('failed', 'Failed'),
-    ]
-    
+    STATUS_CHOICES = STATUS_CHOICES
+
+
     meeting = models.OneToOneField(Meeting, on_delete=models.CASCADE, related_name='insight')
     situation = models.TextField(blank=True)
     insights = models.TextField(blank=True)
@@ -136,7 +158,7 @@ class Insight(models.Model):
     progress = models.IntegerField(default=0)  # 0-100
     error_message = models.TextField(blank=True)
     processing_time = models.DurationField(blank=True, null=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
     
     def __str__(self):
@@ -5,12 +5,33 @@ Implements external transcription using OpenAI's Whisper API service.
 """
 
 import logging
+import mimetypes
+import os
 import requests
 from typing import Dict, Any, List
 from .external_transcribers import ExternalAPITranscriber, TranscriptionResult
 
+# requests_toolbelt is optional: its MultipartEncoder streams the upload
+# body so the audio file is never buffered whole to compute Content-Length
+try:
+    from requests_toolbelt import MultipartEncoder
+    REQUESTS_TOOLBELT_AVAILABLE = True
+except ImportError:
+    REQUESTS_TOOLBELT_AVAILABLE = False
+
+# httpx is optional: a pooled HTTP/2 client reuses one TLS session across
+# the chunk fan-out in transcribe_chunks instead of handshaking per chunk
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Compiled once: validate_configuration runs per transcriber construction
+_VALID_MODELS = frozenset({'whisper-1'})
+
 
 class OpenAITranscriber(ExternalAPITranscriber):
     """OpenAI Whisper API transcription implementation"""
@@ -23,6 +44,28 @@ class OpenAITranscriber(ExternalAPITranscriber):
         # OpenAI-specific settings
         self.temperature = 0.2  # Lower temperature for more consistent results
         self.response_format = "verbose_json"  # Get detailed response with timestamps
+
+        # Pooled keep-alive client shared by all requests when httpx is
+        # installed; the base class falls back to per-request requests.post
+        # otherwise. Concurrency across a meeting's chunks comes from the
+        # base class's thread fan-out, which this pool serves.
+        self.http_client = None
+        if HTTPX_AVAILABLE:
+            limits = httpx.Limits(max_connections=32, max_keepalive_connections=8)
+            try:
+                self.http_client = httpx.Client(http2=True, limits=limits, timeout=self.timeout)
+            except ImportError:
+                # h2 extra not installed; keep-alive pooling alone still
+                # amortizes the handshakes
+                self.http_client = httpx.Client(limits=limits, timeout=self.timeout)
+
+    def __del__(self):
+        """Release pooled connections when the transcriber is dropped"""
+        try:
+            if self.http_client is not None:
+                self.http_client.close()
+        except Exception:
+            pass
     
     def _get_default_model(self) -> str:
         """Get default model for OpenAI"""
@@ -50,25 +93,38 @@ class OpenAITranscriber(ExternalAPITranscriber):
         headers = {
             "Authorization": f"Bearer {self.api_key}"
         }
-        
-        # Prepare form data
-        files = {
-            "file": open(audio_file_path, "rb"),
-            "model": (None, self.api_model),
-            "response_format": (None, self.response_format),
-            "temperature": (None, str(self.temperature))
+
+        # Prepare form fields
+        fields = {
+            "model": self.api_model,
+            "response_format": self.response_format,
+            "temperature": str(self.temperature)
         }
-        
+
         # Add language if specified
         language = kwargs.get('language')
         if language and language != 'auto':
-            files["language"] = (None, language)
-        
+            fields["language"] = language
+
         # Add prompt for better accuracy (optional)
         prompt = kwargs.get('prompt')
         if prompt:
-            files["prompt"] = (None, prompt)
-        
+            fields["prompt"] = prompt
+
+        audio_handle = open(audio_file_path, "rb")
+        content_type = mimetypes.guess_type(audio_file_path)[0] or 'application/octet-stream'
+
+        if REQUESTS_TOOLBELT_AVAILABLE:
+            # Streaming multipart body: the chunk is read in small buffers
+            # as the socket drains instead of being loaded whole up front
+            fields["file"] = (os.path.basename(audio_file_path), audio_handle, content_type)
+            encoder = MultipartEncoder(fields=fields)
+            headers["Content-Type"] = encoder.content_type
+            return self.transcription_endpoint, headers, encoder, 'stream'
+
+        # Fallback: in-memory multipart via requests' files= handling
+        files = {"file": audio_handle}
+        files.update({key: (None, value) for key, value in fields.items()})
         return self.transcription_endpoint, headers, files, 'files'
     
     def _parse_response(self, response: requests.Response) -> TranscriptionResult:
@@ -126,9 +182,8 @@ class OpenAITranscriber(ExternalAPITranscriber):
             return False, "Invalid OpenAI API key format (should start with 'sk-')"
         
         # Validate model
-        valid_models = ['whisper-1']
-        if self.api_model not in valid_models:
-            return False, f"Invalid OpenAI model: {self.api_model}. Valid models: {', '.join(valid_models)}"
+        if self.api_model not in _VALID_MODELS:
+            return False, f"Invalid OpenAI model: {self.api_model}. Valid models: {', '.join(sorted(_VALID_MODELS))}"
         
         return True, ""
     
@@ -516,6 +516,25 @@ def add_chunk_to_transcription_queue(chunk: AudioChunk):
     transcriber.add_chunk_for_transcription(chunk)
 
 
+def add_chunks_to_transcription_queue(chunks):
+    """
+    Add a batch of chunks to the transcription queue in one pass
+
+    Resolves the transcriber once (one registry lock acquisition) instead
+    of a lookup per chunk, so bulk-created chunks are enqueued together.
+
+    Args:
+        chunks: Iterable of AudioChunk instances for the same meeting
+    """
+    chunks = list(chunks)
+    if not chunks:
+        return
+
+    transcriber = ProgressiveTranscriber.get_or_create_transcriber(chunks[0].meeting)
+    for chunk in chunks:
+        transcriber.add_chunk_for_transcription(chunk)
+
+
 def mark_chunking_complete(meeting: Meeting, expected_chunk_count: int = None):
     """
     Mark that chunking is complete for a meeting
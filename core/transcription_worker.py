@@ -0,0 +1,150 @@
+"""
+Subprocess-Isolated Transcription Workers
+
+A thread that outlives its join(timeout) keeps running — holding the
+Whisper model, the GIL, and any accelerator context — so repeated
+timeouts accumulate ghost workers. Running transcription in a child
+process gives real cancellation: on timeout the process is terminated
+and its memory reclaimed by the OS.
+
+Each worker loads its model once at startup and then serves jobs from a
+queue, so isolation does not mean reloading the model per chunk. Workers
+are opt-in via settings.WHISPER_SUBPROCESS_ISOLATION because a child
+process cannot share the in-process model cache with the web workers.
+"""
+
+import logging
+import multiprocessing
+import queue
+import threading
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _worker_main(job_queue, result_queue, whisper_model):
+    """
+    Child process loop: load the model once, then serve transcription jobs
+
+    Runs with chunk=None so the child never touches the database — status
+    updates stay in the parent, and inherited DB connections are closed
+    immediately after fork.
+    """
+    from django.db import connections
+    connections.close_all()
+
+    from .utils import transcribe_audio
+
+    while True:
+        job = job_queue.get()
+        if job is None:
+            break
+
+        audio_path, language = job
+        try:
+            text = transcribe_audio(audio_path, whisper_model, None, language)
+            result_queue.put((True, text))
+        except Exception as e:
+            result_queue.put((False, str(e)))
+
+
+class TranscriptionWorker:
+    """
+    Persistent child process holding one loaded Whisper model
+    """
+
+    def __init__(self, whisper_model: str):
+        self.whisper_model = whisper_model
+        self._job_queue = multiprocessing.Queue()
+        self._result_queue = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=_worker_main,
+            args=(self._job_queue, self._result_queue, whisper_model),
+            daemon=True
+        )
+        self._process.start()
+        logger.info(f"Started transcription worker pid={self._process.pid} "
+                    f"for model {whisper_model}")
+
+    def is_alive(self) -> bool:
+        return self._process.is_alive()
+
+    def transcribe(self, audio_path: str, language: Optional[str], timeout: float) -> str:
+        """
+        Run one transcription job with a hard timeout
+
+        Args:
+            audio_path: Path to audio file
+            language: Language code or None for auto-detection
+            timeout: Seconds to wait before terminating the worker
+
+        Returns:
+            Transcribed text
+
+        Raises:
+            TimeoutError: If the job exceeded the timeout (worker is
+                terminated and must be respawned)
+            Exception: If transcription failed inside the worker
+        """
+        self._job_queue.put((audio_path, language))
+
+        try:
+            success, payload = self._result_queue.get(timeout=timeout)
+        except queue.Empty:
+            self.terminate()
+            raise TimeoutError(f"Transcription exceeded {timeout}s, worker terminated")
+
+        if success:
+            return payload
+        raise Exception(payload)
+
+    def terminate(self):
+        """Kill the child process and reclaim its memory"""
+        try:
+            self._process.terminate()
+            self._process.join(timeout=5)
+        except Exception as e:
+            logger.warning(f"Failed to terminate transcription worker: {e}")
+
+
+# One worker per model, recreated after a timeout kill
+_workers = {}
+_workers_lock = threading.Lock()
+
+
+def _get_worker(whisper_model: str) -> TranscriptionWorker:
+    with _workers_lock:
+        worker = _workers.get(whisper_model)
+        if worker is None or not worker.is_alive():
+            worker = TranscriptionWorker(whisper_model)
+            _workers[whisper_model] = worker
+        return worker
+
+
+def transcribe_with_isolation(audio_path: str, whisper_model: str,
+                              language: Optional[str], timeout: float) -> Tuple[bool, Optional[str], bool]:
+    """
+    Transcribe in an isolated worker process with true timeout enforcement
+
+    Args:
+        audio_path: Path to audio file
+        whisper_model: Whisper model to use
+        language: Language code or None for auto-detection
+        timeout: Timeout in seconds
+
+    Returns:
+        tuple: (success: bool, text: str or None, timed_out: bool) —
+        the same contract as transcribe_audio_with_timeout
+    """
+    try:
+        worker = _get_worker(whisper_model)
+        text = worker.transcribe(audio_path, language, timeout)
+        return (True, text, False)
+    except TimeoutError:
+        with _workers_lock:
+            _workers.pop(whisper_model, None)
+        logger.error(f"Isolated transcription timed out after {timeout}s")
+        return (False, None, True)
+    except Exception as e:
+        logger.error(f"Isolated transcription failed: {e}")
+        return (False, None, False)
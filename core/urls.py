@@ -16,4 +16,5 @@ urlpatterns = [
     path('insights-progress/', views.insights_progress, name='insights_progress'),
     path('save-analysis/', views.save_analysis, name='save_analysis'),
     path('stop-transcription/', views.stop_transcription, name='stop_transcription'),
+    path('webhooks/assemblyai/', views.assemblyai_webhook, name='assemblyai_webhook'),
 ]
\ No newline at end of file
@@ -1,5 +1,6 @@
 import os
 import requests
+import threading
 import time
 import logging
 import platform
@@ -109,9 +110,23 @@ def optimize_for_apple_silicon():
         return True
     return False
 
-# Global model cache to avoid reloading models
+# Global model cache to avoid reloading models. Loads are serialized per
+# model size so concurrent chunk workers can't each load their own copy of
+# the same multi-GB model, while different models (e.g. a parallel preload)
+# still load side by side.
 _model_cache = {}
 _batched_model_cache = {}
+_model_cache_lock = threading.Lock()  # guards the per-model lock table
+_model_locks = {}
+
+
+def _get_model_lock(model_size):
+    """Get the load lock for one model size, creating it on first use"""
+    with _model_cache_lock:
+        lock = _model_locks.get(model_size)
+        if lock is None:
+            lock = _model_locks.setdefault(model_size, threading.Lock())
+        return lock
 
 # VAD and batching utilities for offline processing
 def load_vad_model():
@@ -135,6 +150,43 @@ def load_vad_model():
         logger.warning(f"Could not load VAD model: {e}")
         return None, None
 
+def _load_audio_16k_mono(audio_path):
+    """
+    Decode audio straight to 16kHz mono via ffmpeg, falling back to
+    torchaudio load + resample
+
+    Decoding at the target rate avoids materializing the source-rate
+    waveform (e.g. 48kHz stereo) just to immediately downsample it for VAD.
+    Returns (waveform, sample_rate) with waveform shaped (1, frames).
+    """
+    import subprocess
+    import numpy as np
+    import torch
+    import torchaudio
+
+    try:
+        cmd = [
+            'ffmpeg', '-nostdin', '-v', 'error',
+            '-i', audio_path,
+            '-ar', '16000', '-ac', '1', '-f', 's16le', 'pipe:1'
+        ]
+        result = subprocess.run(cmd, capture_output=True, timeout=300)
+        if result.returncode == 0 and result.stdout:
+            samples = np.frombuffer(result.stdout, dtype=np.int16)
+            wav = torch.from_numpy(samples.astype(np.float32) / 32768.0).unsqueeze(0)
+            return wav, 16000
+        logger.warning(f"ffmpeg 16kHz decode failed: {result.stderr.decode(errors='replace').strip()}")
+    except Exception as e:
+        logger.warning(f"ffmpeg 16kHz decode unavailable: {e}")
+
+    wav, sr = torchaudio.load(audio_path)
+    if sr != 16000:
+        resampler = torchaudio.transforms.Resample(sr, 16000)
+        wav = resampler(wav)
+        sr = 16000
+    return wav, sr
+
+
 def detect_speech_segments(audio_path, vad_model=None, utils=None):
     """
     Detect speech segments in audio file using local VAD
@@ -143,19 +195,10 @@ def detect_speech_segments(audio_path, vad_model=None, utils=None):
     if vad_model is None or utils is None:
         # Fallback: return full audio as single segment
         return [(0.0, None)]
-    
+
     try:
-        import torch
-        import torchaudio
-        
-        # Load audio
-        wav, sr = torchaudio.load(audio_path)
-        
-        # Resample if needed (VAD expects 16kHz)
-        if sr != 16000:
-            resampler = torchaudio.transforms.Resample(sr, 16000)
-            wav = resampler(wav)
-            sr = 16000
+        # Decode at VAD's expected 16kHz mono directly
+        wav, sr = _load_audio_16k_mono(audio_path)
         
         # Get speech timestamps
         speech_timestamps = utils[0](wav, vad_model, sampling_rate=sr)
@@ -180,6 +223,17 @@ def get_or_create_whisper_model(model_size='base'):
     Get or create a Whisper model with caching to avoid reloading
     Optimized for Apple Silicon M4 and offline operation
     """
+    # Fast path: already loaded, no lock needed
+    model = _model_cache.get(model_size)
+    if model is not None:
+        return model
+
+    with _get_model_lock(model_size):
+        return _load_whisper_model_locked(model_size)
+
+
+def _load_whisper_model_locked(model_size):
+    """Load a Whisper model into the cache; caller holds the model's lock"""
     if model_size not in _model_cache:
         logger.info(f"Loading Whisper model: {model_size}")
         
@@ -263,12 +317,23 @@ def get_or_create_batched_model(model_size='base'):
     if not BATCHED_INFERENCE_AVAILABLE:
         logger.info("BatchedInferencePipeline not available, using regular model")
         return get_or_create_whisper_model(model_size)
-        
+
+    # Fast path: already built, no lock needed
+    batched = _batched_model_cache.get(model_size)
+    if batched is not None:
+        return batched
+
+    with _get_model_lock(model_size):
+        return _build_batched_model_locked(model_size)
+
+
+def _build_batched_model_locked(model_size):
+    """Build a batched pipeline in the cache; caller holds the model's lock"""
     if model_size not in _batched_model_cache:
         logger.info(f"Creating enhanced batched inference pipeline for model: {model_size}")
         
-        # Get the base model first
-        base_model = get_or_create_whisper_model(model_size)
+        # Get the base model first (lock is already held, so load directly)
+        base_model = _load_whisper_model_locked(model_size)
         
         # Determine optimal configuration for M4
         is_m_series = is_apple_silicon()
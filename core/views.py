@@ -961,3 +961,43 @@ def stop_transcription(request):
             'success': False,
             'error': f'Failed to stop transcription: {str(e)}'
         }, status=500)
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def assemblyai_webhook(request):
+    """
+    Receive transcription completion callbacks from AssemblyAI
+    
+    AssemblyAI POSTs {"transcript_id": ..., "status": ...} when a job
+    finishes, allowing the polling loop to wake immediately instead of
+    waiting out its backoff delay.
+    """
+    try:
+        data = json.loads(request.body)
+        transcript_id = data.get('transcript_id')
+        status = data.get('status')
+        
+        if not transcript_id:
+            return JsonResponse({'success': False, 'error': 'transcript_id is required'}, status=400)
+        
+        logger.info(f"AssemblyAI webhook received for transcript {transcript_id}: {status}")
+        
+        # Wake any poll loop waiting on this transcript
+        from .assemblyai_transcriber import notify_webhook_completion
+        notify_webhook_completion(transcript_id)
+        
+        return JsonResponse({
+            'success': True,
+            'message': 'Webhook processed'
+        })
+        
+    except json.JSONDecodeError:
+        return JsonResponse({'success': False, 'error': 'Invalid JSON payload'}, status=400)
+        
+    except Exception as e:
+        logger.error(f"Error processing AssemblyAI webhook: {e}")
+        return JsonResponse({
+            'success': False,
+            'error': f'Failed to process webhook: {str(e)}'
+        }, status=500)
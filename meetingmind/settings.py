@@ -213,6 +213,10 @@ LOGGING = {
 # Create logs directory if it doesn't exist
 os.makedirs(BASE_DIR / 'logs', exist_ok=True)
 
+# External transcription API configuration
+# When set, AssemblyAI POSTs completion callbacks here instead of relying on polling alone
+ASSEMBLYAI_WEBHOOK_URL = os.environ.get('ASSEMBLYAI_WEBHOOK_URL', '')
+
 # LLM Configuration
 LLM_API_BASE = os.environ.get('LLM_API_BASE', 'http://localhost:1234/v1')
 LLM_API_KEY = os.environ.get('LLM_API_KEY', 'not-needed')